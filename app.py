@@ -1,11 +1,43 @@
 import streamlit as st
+import gc
 import os
-from dotenv import load_dotenv
-from chatbot import TechnicalInterviewChatbot
-import time
+import re
+import types
+import pathlib
+import functools
 
-# Load environment variables
-load_dotenv()
+# Reruns allocate lots of short-lived strings (message HTML, prompt text),
+# which trips CPython's cyclic GC mid-script. Raising the gen-0 threshold
+# keeps collections out of the rerun hot path; the allocations are acyclic
+# strings, so refcounting reclaims them anyway.
+gc.set_threshold(50_000, 10, 10)
+
+# Chat history is stored column-wise as three parallel lists in session
+# state (msg_roles / msg_contents / rendered_messages) rather than a list
+# of per-message records: just the string payloads, no wrapper object per
+# message, and the render path only ever touches the column it needs.
+
+# Heavy modules (chatbot -> google.generativeai, dotenv) are imported
+# lazily inside the cached factories below so the first page paint isn't
+# blocked on SDK imports.
+
+# Precompiled markdown-to-HTML patterns used for every rendered message.
+# The italic pattern uses lookarounds so it can't chew on leftover bold
+# asterisks.
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_ITALIC_RE = re.compile(r'(?<!\*)\*(?!\*)(.*?)\*(?!\*)')
+_CODE_RE = re.compile(r'`(.*?)`')
+
+# How many chat messages to render per rerun before "Load earlier" kicks in
+MESSAGE_WINDOW = 20
+
+# Pre-interview welcome card, built once at import instead of per rerun
+_WELCOME_HTML = """
+<div class="welcome-message">
+    <h3>Welcome to TechHire AI Interview</h3>
+    <p>Click the button below to start your personalized technical interview session.</p>
+</div>
+"""
 
 # Page configuration
 st.set_page_config(
@@ -16,264 +48,50 @@ st.set_page_config(
 )
 
 # Simplified and working CSS
-st.markdown("""
-<style>
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    
-    /* Main styling */
-    .main > div {
-        padding-top: 1rem;
-    }
-    
-    /* Header */
-    .app-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-    }
-    
-    .app-title {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin: 0;
-        color: white !important;
-    }
-    
-    .app-subtitle {
-        font-size: 1.2rem;
-        margin-top: 0.5rem;
-        color: white !important;
-    }
-    
-    /* Status bar */
-    .status-bar {
-        background: white;
-        border: 2px solid #e1e8ed;
-        border-radius: 12px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-    
-    .status-badge {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-    
-    .progress-container {
-        background: #f0f0f0;
-        border-radius: 10px;
-        height: 8px;
-        width: 200px;
-        margin: 0 1rem;
-    }
-    
-    .progress-bar {
-        height: 100%;
-        background: linear-gradient(90deg, #4facfe 0%, #00f2fe 100%);
-        border-radius: 10px;
-        transition: width 0.3s ease;
-    }
-    
-    /* Chat messages */
-    .chat-message {
-        margin-bottom: 1rem;
-        display: flex;
-        align-items: flex-start;
-        gap: 0.5rem;
-    }
-    
-    .chat-message.user {
-        flex-direction: row-reverse;
-        justify-content: flex-start;
-    }
-    
-    .message-content {
-        max-width: 70%;
-        padding: 1rem 1.2rem;
-        border-radius: 18px;
-        word-wrap: break-word;
-        line-height: 1.5;
-    }
-    
-    .message-content.user {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border-bottom-right-radius: 8px;
-    }
-    
-    .message-content.bot {
-        background: white;
-        color: #333;
-        border: 1px solid #e1e8ed;
-        border-bottom-left-radius: 8px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-    }
-    
-    .message-avatar {
-        width: 32px;
-        height: 32px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.2rem;
-        flex-shrink: 0;
-    }
-    
-    .avatar-user {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    .avatar-bot {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        color: white;
-    }
-    
-    /* Welcome message */
-    .welcome-message {
-        text-align: center;
-        padding: 3rem 2rem;
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        border-radius: 15px;
-        color: white;
-        margin: 2rem 0;
-    }
-    
-    /* Completion card */
-    .completion-card {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 2rem 0;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    }
-    
-    /* Hide empty sidebar containers */
-    .css-1d391kg .element-container:empty {
-        display: none !important;
-    }
-    
-    .css-1d391kg .stMarkdown:empty {
-        display: none !important;
-    }
-    
-    /* Sidebar sections */
-    .sidebar-section {
-        background: rgba(255, 255, 255, 0.15);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        border: 1px solid rgba(255, 255, 255, 0.3);
-        backdrop-filter: blur(10px);
-    }
-    
-    .sidebar-title {
-        color: white !important;
-        font-size: 1.1rem;
-        font-weight: 600;
-        margin-bottom: 1rem;
-        padding-bottom: 0.5rem;
-        border-bottom: 2px solid rgba(255, 255, 255, 0.3);
-    }
-    
-    .info-item {
-        display: flex;
-        align-items: flex-start;
-        margin-bottom: 0.8rem;
-        color: white;
-    }
-    
-    .info-icon {
-        margin-right: 0.8rem;
-        font-size: 1rem;
-        flex-shrink: 0;
-        margin-top: 0.2rem;
-    }
-    
-    .info-value {
-        font-weight: 500;
-        color: white !important;
-        word-wrap: break-word;
-        flex: 1;
-    }
-    
-    .info-label {
-        font-size: 0.8rem;
-        color: rgba(255, 255, 255, 0.8) !important;
-        margin-bottom: 0.2rem;
-    }
-    
-    /* Force sidebar text to be white */
-    .css-1d391kg, .css-1rs6os, .element-container, .stMarkdown {
-        color: white !important;
-    }
-    
-    /* Typing indicator */
-    .typing-indicator {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 1rem;
-        background: white;
-        border-radius: 18px;
-        border: 1px solid #e1e8ed;
-        margin-bottom: 1rem;
-        max-width: 200px;
-        border-bottom-left-radius: 8px;
-    }
-    
-    .typing-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        background: #999;
-        animation: bounce 1.4s infinite ease-in-out;
-    }
-    
-    .typing-dot:nth-child(1) { animation-delay: -0.32s; }
-    .typing-dot:nth-child(2) { animation-delay: -0.16s; }
-    
-    @keyframes bounce {
-        0%, 80%, 100% { transform: scale(0); }
-        40% { transform: scale(1); }
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def _css_block():
+    """Load the static app stylesheet from disk (read once, reused every rerun)."""
+    css = (pathlib.Path(__file__).parent / "static" / "app.css").read_text()
+    return f"<style>{css}</style>"
+
+@st.cache_resource
+def _get_gemini_model(api_key):
+    """Build the Gemini model client once per process and share it across sessions."""
+    from chatbot import create_gemini_model
+    return create_gemini_model(api_key)
+
+@st.cache_resource
+def _get_chatbot_class():
+    """Import the chatbot module on first use and keep the class handle."""
+    from chatbot import TechnicalInterviewChatbot
+    return TechnicalInterviewChatbot
+
+@st.cache_data
+def _load_api_key():
+    """Load .env and read the API key once instead of on every rerun."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv('GOOGLE_API_KEY')
 
 def initialize_session_state():
     """Initialize session state variables."""
     if 'chatbot' not in st.session_state:
-        api_key = os.getenv('GOOGLE_API_KEY')
+        api_key = _load_api_key()
         if not api_key:
             st.error("❌ Google API key not found. Please set GOOGLE_API_KEY in your .env file.")
             st.stop()
-        st.session_state.chatbot = TechnicalInterviewChatbot(api_key)
+        # Per-session interview state lives in the chatbot; the heavy SDK
+        # client is shared process-wide via the cached factory above.
+        st.session_state.chatbot = _get_chatbot_class()(api_key, model=_get_gemini_model(api_key))
     
-    if 'messages' not in st.session_state:
-        st.session_state.messages = []
+    if 'msg_roles' not in st.session_state:
+        st.session_state.msg_roles = []
+
+    if 'msg_contents' not in st.session_state:
+        st.session_state.msg_contents = []
+
+    if 'rendered_messages' not in st.session_state:
+        st.session_state.rendered_messages = []
     
     if 'interview_started' not in st.session_state:
         st.session_state.interview_started = False
@@ -281,37 +99,49 @@ def initialize_session_state():
     if 'interview_completed' not in st.session_state:
         st.session_state.interview_completed = False
     
-    if 'show_typing' not in st.session_state:
-        st.session_state.show_typing = False
+    if 'msg_window' not in st.session_state:
+        st.session_state.msg_window = MESSAGE_WINDOW
 
-def display_header():
-    """Display the application header."""
-    st.markdown("""
+@st.cache_data
+def _header_block():
+    """Return the static application header HTML."""
+    return """
     <div class="app-header">
         <h1 class="app-title">🤖 TechHire AI Interview Assistant</h1>
         <p class="app-subtitle">Streamlined Technical Interviews with AI-Powered Assessment</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
 
-def display_status():
-    """Display the current interview status."""
-    # Fix: Access chatbot from session state
-    chatbot = st.session_state.chatbot
-    state = chatbot.get_conversation_state()
-    current_state = state['current_state']  # Extract the string value
-    
-    status_map = {
-        'greeting': ("👋 Welcome", 5),
-        'collecting_info': ("📝 Collecting Information", 25),
-        'tech_stack': ("🔍 Analyzing Profile", 35), 
-        'technical_questions': ("💻 Technical Interview", 70),
-        'completed': ("✅ Completed", 100)
-    }
-    
-    # Use current_state (the string), NOT state (the dict)
-    current_status, progress = status_map.get(current_state, ("🔄 In Progress", 0))
-    
-    st.markdown(f"""
+def display_header():
+    """Display the application header."""
+    st.markdown(_header_block(), unsafe_allow_html=True)
+
+# Interview state -> (status label, progress %) for the status bar
+# (read-only so reruns can't mutate it and no per-call rebuild is needed)
+_STATUS_MAP = types.MappingProxyType({
+    'greeting': ("👋 Welcome", 5),
+    'collecting_info': ("📝 Collecting Information", 25),
+    'tech_stack': ("🔍 Analyzing Profile", 35),
+    'technical_questions': ("💻 Technical Interview", 70),
+    'completed': ("✅ Completed", 100)
+})
+
+# Candidate profile fields shown in the sidebar: (key, icon, label)
+_INFO_ITEMS = (
+    ('full_name', '👤', 'Name'),
+    ('email', '📧', 'Email'),
+    ('phone', '📱', 'Phone'),
+    ('experience_years', '💼', 'Experience'),
+    ('desired_positions', '🎯', 'Position'),
+    ('location', '📍', 'Location'),
+    ('tech_stack', '💻', 'Tech Stack')
+)
+
+@st.cache_data
+def _status_html(current_state):
+    """Render the status bar HTML for a given state (cached per state)."""
+    current_status, progress = _STATUS_MAP.get(current_state, ("🔄 In Progress", 0))
+    return f"""
     <div class="status-bar">
         <div class="status-badge">{current_status}</div>
         <div class="progress-container">
@@ -319,61 +149,88 @@ def display_status():
         </div>
         <div style="font-weight: 600; color: #666; font-size: 0.9rem;">{progress}%</div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def display_status():
+    """Display the current interview status."""
+    # Read the state string directly; no need to build the full
+    # conversation-state dict just for the status bar.
+    current_state = st.session_state.chatbot.current_state
 
-def display_message(role, content):
-    """Display a single message in the chat."""
+    st.markdown(_status_html(current_state), unsafe_allow_html=True)
+
+@functools.lru_cache(maxsize=512)
+def render_message_html(role, content):
+    """Convert one chat message to its HTML representation.
+
+    lru_cache lets identical messages (the greeting, boilerplate prompts)
+    reuse one rendered string across sessions in the same process.
+    """
     # Clean content
     content = content.strip().replace('\n', '<br>')
-    
+
     # Basic markdown formatting
-    import re
-    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-    content = re.sub(r'\*(.*?)\*', r'<em>\1</em>', content)
-    content = re.sub(r'`(.*?)`', r'<code>\1</code>', content)
-    
+    content = _BOLD_RE.sub(r'<strong>\1</strong>', content)
+    content = _ITALIC_RE.sub(r'<em>\1</em>', content)
+    content = _CODE_RE.sub(r'<code>\1</code>', content)
+
     if role == "user":
-        st.markdown(f"""
+        return f"""
         <div class="chat-message user">
             <div class="message-content user">{content}</div>
             <div class="message-avatar avatar-user">👤</div>
         </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-        <div class="chat-message bot">
-            <div class="message-avatar avatar-bot">🤖</div>
-            <div class="message-content bot">{content}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        """
+    return f"""
+    <div class="chat-message bot">
+        <div class="message-avatar avatar-bot">🤖</div>
+        <div class="message-content bot">{content}</div>
+    </div>
+    """
+
+def append_message(role, content):
+    """Add a message to the conversation and render it once, at append time.
+
+    History is immutable, so each message's HTML is computed exactly once
+    and reused on every subsequent rerun instead of re-formatting the whole
+    conversation each time.
+    """
+    st.session_state.msg_roles.append(role)
+    st.session_state.msg_contents.append(content)
+    st.session_state.rendered_messages.append(render_message_html(role, content))
 
 def display_chat_interface():
     """Display the main chat interface."""
+    # Completed interviews have an immutable history: join it once, then
+    # emit the stored string on every later rerun with zero processing.
+    if st.session_state.interview_completed and st.session_state.rendered_messages:
+        if 'final_html' not in st.session_state:
+            st.session_state.final_html = ''.join(st.session_state.rendered_messages)
+        st.markdown(st.session_state.final_html, unsafe_allow_html=True)
+        return
+
     # Display messages
-    if len(st.session_state.messages) == 0:
-        st.markdown("""
-        <div class="welcome-message">
-            <h3>Welcome to TechHire AI Interview</h3>
-            <p>Click the button below to start your personalized technical interview session.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    if not st.session_state.rendered_messages:
+        # Park the welcome card in an st.empty placeholder so the start
+        # handler can blank it in-place within the same fragment run; once
+        # the first message lands this branch stops emitting it entirely.
+        welcome_slot = st.empty()
+        welcome_slot.markdown(_WELCOME_HTML, unsafe_allow_html=True)
+        st.session_state._welcome_slot = welcome_slot
     else:
-        for message in st.session_state.messages:
-            display_message(message["role"], message["content"])
-    
-    # Show typing indicator
-    if st.session_state.show_typing:
-        st.markdown("""
-        <div class="chat-message bot">
-            <div class="message-avatar avatar-bot">🤖</div>
-            <div class="typing-indicator">
-                <div class="typing-dot"></div>
-                <div class="typing-dot"></div>
-                <div class="typing-dot"></div>
-                <span style="margin-left: 0.5rem; color: #999; font-size: 0.9rem;">AI is thinking...</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Render only the most recent window of messages so rerun cost stays
+        # bounded as the conversation grows. The full list stays in
+        # session_state, so nothing is lost - just not rendered.
+        rendered = st.session_state.rendered_messages
+        window = st.session_state.msg_window
+        if len(rendered) > window:
+            if st.button(f"⬆️ Load earlier messages ({len(rendered) - window} hidden)"):
+                st.session_state.msg_window = window + MESSAGE_WINDOW
+                st.rerun()
+        # One markdown element for the whole visible window: one delta to
+        # serialize and one component for the client to reconcile.
+        st.markdown(''.join(st.session_state.rendered_messages[-window:]),
+                    unsafe_allow_html=True)
 
 def handle_user_input():
     """Handle user input and chatbot response."""
@@ -385,13 +242,21 @@ def handle_user_input():
         with col2:
             if st.button("🚀 Start Interview", type="primary", use_container_width=True):
                 greeting = chatbot.get_greeting_message()
-                st.session_state.messages.append({"role": "assistant", "content": greeting})
+                append_message("assistant", greeting)
                 st.session_state.interview_started = True
-                st.rerun()
+                # Blank the welcome card in-place so it never coexists with
+                # the greeting, even for the instant before the rerun lands.
+                welcome_slot = st.session_state.pop('_welcome_slot', None)
+                if welcome_slot is not None:
+                    welcome_slot.empty()
+                # Starting only swaps the welcome card for the greeting;
+                # header/status/sidebar are unchanged, so stay in-fragment.
+                st.rerun(scope="fragment")
         return
     
-    # Check if interview is completed
-    if chatbot.get_conversation_state()['current_state'] == "completed":
+    # Check if interview is completed (read the state attribute directly
+    # instead of building the full conversation-state dict)
+    if chatbot.current_state == chatbot.COMPLETED:
         st.session_state.interview_completed = True
         display_completion_card()
         return
@@ -403,33 +268,30 @@ def handle_user_input():
     )
     
     if user_input and user_input.strip():
-        # Add user message
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        
-        # Show typing and process response
-        st.session_state.show_typing = True
-        st.rerun()
+        # Add the user message and answer it in this same script run -
+        # no intermediate rerun just to flip a typing flag.
+        append_message("user", user_input)
+        st.markdown(st.session_state.rendered_messages[-1], unsafe_allow_html=True)
 
-def process_bot_response():
-    """Process bot response after user input."""
-    if st.session_state.show_typing and len(st.session_state.messages) > 0:
-        chatbot = st.session_state.chatbot
-        last_message = st.session_state.messages[-1]
-        
-        if last_message["role"] == "user":
-            try:
-                bot_response = chatbot.process_message(last_message["content"])
-                st.session_state.messages.append({"role": "assistant", "content": bot_response})
-                st.session_state.show_typing = False
-                st.rerun()
-            except Exception as e:
-                error_message = f"Sorry, I encountered an error: {str(e)}. Please try again."
-                st.session_state.messages.append({"role": "assistant", "content": error_message})
-                st.session_state.show_typing = False
-                st.rerun()
+        try:
+            # st.write_stream renders the reply progressively (with the
+            # native streaming cursor) as chunks arrive; the styled chat
+            # bubble replaces it on the rerun below.
+            bot_response = st.write_stream(chatbot.process_message_stream(user_input))
+        except Exception as e:
+            bot_response = f"Sorry, I encountered an error: {str(e)}. Please try again."
 
+        append_message("assistant", bot_response)
+        st.rerun()
+
+@st.fragment
 def display_completion_card():
-    """Display interview completion message."""
+    """Display interview completion message.
+
+    Runs as its own fragment: once the interview is completed this view is
+    frozen, so stray reruns re-execute only this block until the reset
+    button triggers a full app rerun.
+    """
     st.markdown("""
     <div class="completion-card">
         <h2>🎉 Interview Completed Successfully!</h2>
@@ -440,94 +302,118 @@ def display_completion_card():
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
         if st.button("🔄 Start New Interview", type="secondary", use_container_width=True):
-            # Reset session state
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            # Reset session state in one bulk clear. The shared Gemini client
+            # lives in st.cache_resource, so it survives the reset.
+            st.session_state.clear()
             st.rerun()
 
+@st.cache_data
+def _candidate_info_html(rows):
+    """Build the candidate profile section as one HTML block.
+
+    Cached on the (icon, label, value) rows, so reruns that didn't change
+    the candidate info skip the string build entirely.
+    """
+    parts = ['<div class="sidebar-section">',
+             '<h4 class="sidebar-title">👤 Candidate Profile</h4>']
+    for icon, label, value in rows:
+        parts.append(f"""
+        <div class="info-item">
+            <span class="info-icon">{icon}</span>
+            <div>
+                <div class="info-label">{label}</div>
+                <div class="info-value">{value}</div>
+            </div>
+        </div>
+        """)
+    parts.append('</div>')
+    return ''.join(parts)
+
+@st.cache_data
+def _sidebar_static_html():
+    """Return the static Help and About sidebar sections as one block."""
+    return """
+    <div class="sidebar-section">
+        <h4 class="sidebar-title">💡 Help & Tips</h4>
+        <strong>Commands:</strong>
+        <ul>
+            <li>Type "exit", "quit", or "bye" to end</li>
+            <li>Type "skip" to skip a question</li>
+        </ul>
+        <strong>Tips:</strong>
+        <ul>
+            <li>Be specific about your tech stack</li>
+            <li>Provide detailed answers</li>
+            <li>Mention specific projects/examples</li>
+            <li>Maximum 6 questions per interview</li>
+        </ul>
+        <strong>Features:</strong>
+        <ul>
+            <li>Adaptive questions based on experience</li>
+            <li>Dynamic follow-up questions</li>
+            <li>Real-time assessment</li>
+            <li>Personalized interview flow</li>
+        </ul>
+    </div>
+    <div class="sidebar-section">
+        <h4 class="sidebar-title">ℹ️ About</h4>
+        <div style="text-align: center;">
+            <strong>TechHire AI Assistant</strong><br>
+            <em>Version 2.0</em><br><br>
+            Powered by Google Gemini AI<br>
+            Built with Streamlit<br><br>
+            🔒 Secure • 🚀 Fast • 🎯 Accurate
+        </div>
+    </div>
+    """
+
 def display_sidebar_content():
     """Display sidebar content without empty containers."""
     chatbot = st.session_state.chatbot
-    
-    # Candidate Info Section
+
+    # Candidate Info Section. The row scan only happens when candidate_info
+    # actually changed (tracked by the chatbot's info_version counter);
+    # unchanged reruns reuse the HTML snapshot from session_state.
+    profile_html = ""
     if hasattr(chatbot, 'candidate_info') and chatbot.candidate_info:
-        st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-        st.markdown('<h4 class="sidebar-title">👤 Candidate Profile</h4>', unsafe_allow_html=True)
-        
-        info_items = [
-            ('full_name', '👤', 'Name'),
-            ('email', '📧', 'Email'),
-            ('phone', '📱', 'Phone'),
-            ('experience_years', '💼', 'Experience'),
-            ('desired_positions', '🎯', 'Position'),
-            ('location', '📍', 'Location'),
-            ('tech_stack', '💻', 'Tech Stack')
-        ]
-        
-        for key, icon, label in info_items:
-            if key in chatbot.candidate_info and chatbot.candidate_info[key]:
-                value = chatbot.candidate_info[key]
-                if key == 'experience_years' and value:
+        version = getattr(chatbot, 'info_version', None)
+        snapshot = st.session_state.get('_profile_snapshot')
+        if snapshot is not None and snapshot[0] == version:
+            profile_html = snapshot[1]
+        else:
+            rows = []
+            candidate_info = chatbot.candidate_info
+            for key, icon, label in _INFO_ITEMS:
+                value = candidate_info.get(key)
+                if not value:
+                    continue
+                if key == 'experience_years':
                     try:
                         experience_level = chatbot.get_experience_level(value)
                         value = f"{value} years ({experience_level.title()})"
                     except:
                         value = f"{value} years"
-                
-                st.markdown(f"""
-                <div class="info-item">
-                    <span class="info-icon">{icon}</span>
-                    <div>
-                        <div class="info-label">{label}</div>
-                        <div class="info-value">{value}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Help Section
-    st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-    st.markdown('<h4 class="sidebar-title">💡 Help & Tips</h4>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    **Commands:**
-    - Type "exit", "quit", or "bye" to end
-    - Type "skip" to skip a question
-    
-    **Tips:**
-    - Be specific about your tech stack
-    - Provide detailed answers
-    - Mention specific projects/examples
-    - Maximum 6 questions per interview
-    
-    **Features:**
-    - Adaptive questions based on experience
-    - Dynamic follow-up questions
-    - Real-time assessment
-    - Personalized interview flow
-    """)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # About Section
-    st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-    st.markdown('<h4 class="sidebar-title">ℹ️ About</h4>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style="text-align: center;">
-        <strong>TechHire AI Assistant</strong><br>
-        <em>Version 2.0</em><br><br>
-        Powered by Google Gemini AI<br>
-        Built with Streamlit<br><br>
-        🔒 Secure • 🚀 Fast • 🎯 Accurate
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+                rows.append((icon, label, value))
+            profile_html = _candidate_info_html(tuple(rows))
+            st.session_state._profile_snapshot = (version, profile_html)
+
+    # Entire sidebar in one markdown call: the profile block (cached per
+    # content) plus the static Help/About block
+    st.markdown(profile_html + _sidebar_static_html(), unsafe_allow_html=True)
+
+@st.fragment
+def chat_panel():
+    """Chat area fragment: reruns on chat interaction without re-executing
+    the sidebar, header, or status bar. Bot responses still trigger a full
+    app rerun since they can change candidate info and interview state."""
+    display_chat_interface()
+    handle_user_input()
 
 def main():
     """Main application function."""
+    # Inject the cached stylesheet first so the page styles paint immediately
+    st.markdown(_css_block(), unsafe_allow_html=True)
+
     # Initialize session state
     initialize_session_state()
 
@@ -538,9 +424,7 @@ def main():
     # Main content
     display_header()
     display_status()
-    display_chat_interface()
-    handle_user_input()
-    process_bot_response()
+    chat_panel()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,21 +1,333 @@
 import google.generativeai as genai
+import difflib
+import functools
 import json
+import logging
 import os
-from datetime import datetime
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import re
+from dataclasses import dataclass
 from sentiment_analyzer import SentimentAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between streamed reply flushes; caps the UI rerender
+# rate regardless of how fast chunks are produced
+STREAM_FLUSH_INTERVAL = 0.25
+
+# Token budget (4-chars-per-token estimate) for verbatim Q&A context in
+# prompts; newest exchanges are packed in until the budget runs out
+QA_CONTEXT_TOKEN_BUDGET = 1024
+
+# Fold older Q&A into a rolling summary once the transcript exceeds this
+# many responses, keeping the last two verbatim
+HISTORY_SUMMARY_THRESHOLD = 6
+
+# Process-wide ceiling on in-flight Gemini generations. Streamlit serves
+# every session from one process, and each turn can run calls on the main
+# thread and the sentiment executor at once; the gate keeps a burst of
+# concurrent sessions from tripping the per-project request-rate cap.
+MAX_CONCURRENT_GENERATIONS = 4
+_GENERATION_GATE = threading.Semaphore(MAX_CONCURRENT_GENERATIONS)
+
+# Per-project Gemini quota dimensions. Requests are paced against both
+# before they hit the wire, so bursts queue locally instead of drawing
+# 429s whose retry backoff would dominate tail latency.
+GEMINI_RPM_LIMIT = 60
+GEMINI_TPM_LIMIT = 120_000
+
+class _TokenBucket:
+    """Thread-safe blocking token bucket with continuous refill.
+
+    acquire() sleeps until the requested allowance is available, so
+    callers are paced below the configured per-minute limit rather than
+    failing and retrying after the server rejects them.
+    """
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.rate
+            time.sleep(min(wait, 1.0))
+
+_REQUEST_BUCKET = _TokenBucket(GEMINI_RPM_LIMIT)
+_PROMPT_TOKEN_BUCKET = _TokenBucket(GEMINI_TPM_LIMIT)
+
+# Retry policy for throttled/transient generation failures: exponential
+# backoff with full jitter, capped so a stuck endpoint can't stall a turn
+# indefinitely
+GENERATION_MAX_ATTEMPTS = 4
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_CAP_SECONDS = 8.0
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Whether a generation failure is a throttle or transient server error
+    worth retrying. The SDK surfaces these as google.api_core exceptions;
+    matching on the status code / message avoids depending on their types.
+    """
+    if getattr(exc, "code", None) in (429, 500, 503):
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in
+               ("429", "rate limit", "resource exhausted", "quota",
+                "unavailable", "deadline exceeded", "internal error"))
+
+# Precompiled patterns for question normalization, which runs on every
+# duplicate check; compiling at module scope skips the per-call pattern
+# cache lookup in the re module.
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_PUNCT_RE = re.compile(r'[.!?]+$')
+_QUESTION_TAG_RE = re.compile(r'\[q-\d+\]')
+_QUESTION_NUM_RE = re.compile(r'question \d+:')
+_WORD_RE = re.compile(r'\w+')
+_STOP_WORDS = frozenset(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
+
+# Paraphrase threshold for character-trigram Jaccard in the duplicate
+# check; trigram overlap survives rewordings that change the word bag
+TRIGRAM_SIMILARITY_THRESHOLD = 0.7
+
+def _char_trigrams(text: str) -> frozenset:
+    """Character-3-gram shingle set of a normalized question."""
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+# Keyword tables for response-pattern scanning, one compiled alternation
+# per category so every answer is walked by the C regex engine instead of
+# one str.__contains__ pass per phrase. Phrases are lowercased to match
+# the lowercased answers they're scanned against.
+_RESPONSE_INDICATORS = {
+    "practical": ("project", "implemented", "built", "deployed", "used", "worked with", "experience"),
+    "theoretical": ("should", "would", "could", "theory", "concept", "generally", "typically"),
+    "confident": ("i have", "i've done", "i built", "i implemented", "i led", "i designed"),
+    "uncertain": ("i think", "maybe", "probably", "i'm not sure", "i believe", "i guess"),
+    "project_work": ("project", "application", "system", "platform"),
+    "team_work": ("team", "collaborated", "worked with", "led", "managed"),
+    "problem_solving": ("problem", "issue", "bug", "fixed", "solved", "optimized"),
+    "production": ("production", "deployed", "live", "users", "scale"),
+}
+_INDICATOR_PATTERNS = {
+    category: re.compile('|'.join(re.escape(phrase) for phrase in phrases))
+    for category, phrases in _RESPONSE_INDICATORS.items()
+}
+
+# Keyword alternations for fallback_sentiment_analysis, compiled once so
+# each category is a single regex pass instead of one substring scan per
+# keyword
+_FALLBACK_SENTIMENT_PATTERNS = {
+    category: re.compile('|'.join(re.escape(word) for word in words))
+    for category, words in {
+        "confident": ("definitely", "certainly", "absolutely", "sure", "confident", "know", "experienced"),
+        "uncertain": ("maybe", "perhaps", "think", "believe", "probably", "not sure", "guess"),
+        "technical": ("implement", "architecture", "database", "algorithm", "optimization", "framework", "api"),
+    }.items()
+}
+
+# Static interviewer rubric, shared by every generation prompt. Uploaded
+# once per session as a Gemini context cache (see ensure_context_cache), so
+# per-call prompts only carry the dynamic tail: candidate variables, Q&A
+# context, and the uniqueness constraint. When caching is unavailable,
+# generate() prepends this text to each prompt instead.
+INTERVIEWER_INSTRUCTIONS = """You are a technical interview assistant conducting a structured
+interview.
+
+QUESTION GENERATION RULES (apply whenever asked to generate a question):
+1. The question must be SPECIFIC to the candidate's primary technology and target role.
+2. Match complexity to their experience level: junior candidates get guided, step-by-step
+   scenarios; mid-level get debugging and optimization scenarios; senior get architecture and
+   scale decisions; expert get migration, strategy, and leadership scenarios.
+3. Questions must be scenario-based and practical, reflecting real-world work in the target
+   role, and should allow for follow-up questions based on the answer.
+4. Never repeat or closely paraphrase a question that was already asked - every question must
+   be completely unique.
+5. When asked for a question, return ONLY the question text, no additional commentary.
+
+ANALYSIS RULES: analyze answers for technical depth, confidence, and evidence of practical
+experience. When asked for JSON, return only valid JSON with exactly the requested keys."""
+
+# Pre-rendered invariant prompt sections. The static head of the fused
+# analysis prompt (instruction plus JSON spec) never changes, so it is
+# built once here and only the dynamic tail is interpolated per turn;
+# keeping it verbatim-stable also helps the server-side prefix cache.
+_ANALYSIS_PROMPT_PREFIX = """
+            Analyze this candidate's technical response in detail.
+
+            Provide detailed analysis in JSON format:
+            {
+                "response_quality": "excellent/good/average/poor",
+                "technical_depth": "deep/moderate/shallow",
+                "knowledge_level_shown": "expert/advanced/intermediate/beginner",
+                "specific_strengths": ["list specific technical strengths shown"],
+                "knowledge_gaps": ["areas where knowledge seems limited"],
+                "follow_up_opportunities": ["specific areas to probe deeper"],
+                "buzzwords_vs_understanding": "genuine_understanding/surface_level/mixed",
+                "practical_experience_evident": true/false,
+                "needs_followup": true/false,
+                "followup_type": "clarification/deeper_dive/practical_application/edge_cases",
+                "suggested_followup": "specific follow-up question if needed - must be UNIQUE from all previous questions",
+                "next_question": "the next main technical question to ask if no follow-up is needed - must target an uncovered technology and be UNIQUE from all previous questions"
+            }
+"""
+
+# Static head and tail of the overall-sentiment prompt; only the compact
+# sentiment JSON between them changes per interview.
+_OVERALL_PROMPT_PREFIX = """
+            Analyze the overall interview performance based on individual response sentiments:
+
+            Individual Response Sentiments: """
+
+_OVERALL_PROMPT_SUFFIX = """
+
+            Provide overall assessment in JSON format:
+            {
+                "overall_confidence": "high/medium/low",
+                "technical_competency": "excellent/good/average/needs_improvement",
+                "communication_clarity": "excellent/good/average/poor",
+                "interview_performance": "strong/satisfactory/weak",
+                "key_strengths": ["list main strengths"],
+                "areas_for_improvement": ["list improvement areas"],
+                "hiring_recommendation": "strong_yes/yes/maybe/no",
+                "summary": "brief overall summary"
+            }
+            """
+
+# Fallback question templates, rendered with str.format only for the one
+# template actually used instead of interpolating every variant per call.
+_FALLBACK_FIRST_QUESTIONS = {
+    "junior": "Walk me through how you would build a simple {position} feature using {tech}. What would be your step-by-step approach?",
+    "mid-level": "You're tasked with optimizing a slow-performing {tech} application in a {position} role. What's your debugging and optimization strategy?",
+    "senior": "Design a scalable {tech} solution for a {position} team handling 100k+ users. What architectural decisions would you make?",
+    "expert": "You're leading a {position} team migrating from legacy {tech} to modern stack. How do you plan and execute this transition?",
+}
+
+_FALLBACK_NEXT_TEMPLATES = (
+    "Tell me about a challenging problem you solved using {tech} in the context of {position} work. What was your approach?",
+    "Describe the most complex {position} project you've worked on. What technical challenges did you face and how did you overcome them?",
+    "How do you approach code reviews and quality assurance in {position} projects?",
+    "What's your experience with testing strategies in {position} development?",
+    "How do you handle performance optimization in your {position} work?",
+)
+
+# Process-wide cache of profile analyses keyed by candidate fingerprint.
+# Profile analysis is a pure function of the fingerprint, so restarted
+# interviews with the same details (the "Start New Interview" path) skip
+# the Gemini call entirely.
+_PROFILE_ANALYSIS_CACHE = {}
+
+@dataclass(slots=True)
+class ResponseEntry:
+    """One interview exchange. Slots keep per-entry overhead to the field
+    pointers themselves - no instance dict and no per-entry key strings -
+    which matters when one process holds many long sessions."""
+    question: str
+    answer: str
+    question_number: int
+    timestamp: str
+    sentiment_analysis: Optional[Dict] = None
+
+# Process-wide cache of opening questions. The first question is almost
+# fully determined by (experience level, position category, tech stack
+# tokens) - a small space that repeats constantly across candidates - so
+# repeat-shaped profiles reuse a previously generated question instead of
+# paying a fresh generation round trip.
+_FIRST_QUESTION_CACHE = {}
+
+# Generative cache for answer analyses: normalized question -> list of
+# (answer word set, parsed analysis). Candidate answers to the same
+# question are frequently paraphrases of each other, and their analyses
+# and follow-ups come out nearly identical, so a close-enough cached
+# answer is reused instead of paying a fresh analysis call.
+_ANSWER_ANALYSIS_CACHE = {}
+ANSWER_SIMILARITY_THRESHOLD = 0.9
+
+# Process-wide cache of per-answer sentiment results keyed by response
+# text. Stock answers ("not sure", "I don't know", boilerplate skips)
+# repeat constantly across candidates, and each hit saves a full model
+# round trip for any chatbot instance in the worker.
+_SENTIMENT_RESULT_CACHE = {}
+
+@functools.lru_cache(maxsize=None)
+def _configure_genai(api_key: str) -> None:
+    """Configure SDK credentials once per key.
+
+    genai.configure resets global SDK state (credentials, channel options);
+    the lru_cache makes repeat calls with the same key a no-op so direct
+    chatbot construction without a shared model can't thrash it.
+    """
+    genai.configure(api_key=api_key)
+
+@functools.lru_cache(maxsize=4)
+def create_gemini_model(api_key: str):
+    """Configure the Gemini SDK and return a GenerativeModel client.
+
+    The client holds auth state and connection pools; caching per key means
+    every chatbot instance in the process shares one client (and its
+    underlying connections) even when callers don't pass a shared model in.
+    """
+    _configure_genai(api_key)
+    # Flash is materially faster at prefill/decode than gemini-pro for the
+    # short interactive turns this app makes, and matches the model family
+    # used by the context cache.
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+@functools.lru_cache(maxsize=4)
+def _get_sentiment_analyzer(model) -> SentimentAnalyzer:
+    """Return a shared SentimentAnalyzer for the given model client.
+
+    The analyzer is stateless beyond the model reference, so one instance
+    per client serves every chatbot in the process.
+    """
+    return SentimentAnalyzer(model)
+
 class TechnicalInterviewChatbot:
-    def __init__(self, api_key: str):
-        """Initialize the chatbot with Google Gemini API."""
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
-        
+    def __init__(self, api_key: str, model=None):
+        """Initialize the chatbot with Google Gemini API.
+
+        If a pre-built model client is passed, it is reused instead of
+        creating a fresh one (avoids repeating SDK setup per session).
+        """
+        self.model = model if model is not None else create_gemini_model(api_key)
+
+        # Explicit Gemini context cache for the static instructions +
+        # candidate profile snapshot (built lazily; see ensure_context_cache)
+        self._cached_model = None
+        self._context_cache_key = None
+
         # Initialize sentiment analyzer
-        self.sentiment_analyzer = SentimentAnalyzer(self.model)
+        self.sentiment_analyzer = _get_sentiment_analyzer(self.model)
         self.sentiment_analysis = None
         self.individual_sentiments = []  # Store individual response sentiments
+        # (length, serialized) memo for the overall-sentiment prompt dump;
+        # the list is append-only, so length is a sound invalidation key
+        self._sentiments_json_cache = None
+
+        # Background workers for model calls that don't block the main reply
+        # (e.g. sentiment runs concurrently with follow-up generation);
+        # sized to the generation gate so queued work never waits on a
+        # worker while a semaphore slot is free
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_GENERATIONS)
+
+        # Token accounting accumulated from usage_metadata across calls;
+        # cached_tokens vs prompt_tokens shows whether the context cache
+        # and prefix-first prompt ordering are actually hitting
+        self.metrics = {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
 
         # Conversation states
         self.GREETING = "greeting"
@@ -26,9 +338,29 @@ class TechnicalInterviewChatbot:
         
         self.current_state = self.GREETING
         self.candidate_info = {}
+        # Level bucket derived once when experience_years is collected;
+        # hot paths read this instead of re-deriving it from the raw string
+        self.experience_level = "mid-level"
+        # Bumped on every candidate_info mutation; lets the UI detect
+        # changes without comparing dict contents
+        self.info_version = 0
         self.tech_questions = []
         self.current_question_index = 0
         self.responses = []
+
+        # Incrementally-maintained response counters so UI reads are O(1)
+        # instead of rescanning self.responses every rerun
+        self.response_counters = {"total": 0, "answered": 0, "skipped": 0}
+
+        # Rolling summary of responses older than the verbatim context tail
+        self.history_summary = ""
+        self._summarized_upto = 0
+
+        # Running indicator-phrase counts; responses are append-only, so
+        # each new answer is scanned exactly once
+        self._indicator_counts = {category: 0 for category in _INDICATOR_PATTERNS}
+        self._indicator_scanned = 0
+        self._response_len_sum = 0
         
         # Enhanced candidate profile analysis
         self.candidate_profile = {}
@@ -37,8 +369,22 @@ class TechnicalInterviewChatbot:
         self.skill_depth_assessment = {}
         
         # Question tracking to prevent duplicates
-        self.asked_questions = set()
         self.asked_questions_raw = []
+        # Inverted index over asked-question tokens: token -> question
+        # indices, plus each question's frozen token set, so duplicate
+        # checks only compare against questions sharing a token
+        self._question_token_sets = []
+        self._question_shingle_sets = []
+        self._normalized_questions = []
+        self._token_postings = {}
+
+        # Compiled tech-stack alternation regex and normalized token list,
+        # rebuilt only when the stack changes
+        self._tech_pattern_source = None
+        self._tech_pattern_compiled = None
+        self._tech_tokens = []
+        # Single-slot memo for get_uncovered_technologies: (key, result)
+        self._uncovered_cache = None
         
         # Information fields to collect
         self.info_fields = [
@@ -54,6 +400,14 @@ class TechnicalInterviewChatbot:
         
         # Exit keywords
         self.exit_keywords = ["exit", "quit", "bye", "goodbye", "end", "stop"]
+
+        # Table-driven state dispatch for process_input: one dict lookup
+        # per message instead of walking an if/elif chain of string compares
+        self._state_handlers = {
+            self.GREETING: self.handle_greeting,
+            self.COLLECTING_INFO: self.handle_info_collection,
+            self.TECHNICAL_QUESTIONS: self.handle_technical_questions,
+        }
         
         # Enhanced position-specific question templates
         self.position_question_templates = {
@@ -66,12 +420,113 @@ class TechnicalInterviewChatbot:
             "qa": ["test automation", "test strategies", "bug tracking", "performance testing", "security testing"]
         }
     
+    def ensure_context_cache(self):
+        """Upload the static interviewer instructions + candidate profile as
+        a Gemini context cache so they aren't resent with every call.
+
+        Rebuilt only when candidate_info changes. Falls back silently to the
+        plain model when caching is unavailable (unsupported model, cache
+        minimum-size limits, offline, older SDK).
+        """
+        snapshot = json.dumps(self.candidate_info, sort_keys=True)
+        if snapshot == self._context_cache_key:
+            return
+
+        self._context_cache_key = snapshot
+        try:
+            from google.generativeai import caching
+            cache = caching.CachedContent.create(
+                model="models/gemini-1.5-flash-001",
+                system_instruction=INTERVIEWER_INSTRUCTIONS,
+                contents=[f"CANDIDATE PROFILE SNAPSHOT:\n{snapshot}"],
+                ttl=timedelta(hours=1),
+            )
+            self._cached_model = genai.GenerativeModel.from_cached_content(cached_content=cache)
+        except Exception as e:
+            logger.warning("Context caching unavailable, using plain model: %s", e)
+            self._cached_model = None
+
+    def generate(self, prompt: str, json_output: bool = False):
+        """Run a generation against the context-cached model when available,
+        otherwise against the plain shared model.
+
+        The cached model already carries INTERVIEWER_INSTRUCTIONS as its
+        system instruction, so only the dynamic prompt is tokenized per
+        call; the fallback path prepends the same rubric so behavior is
+        identical either way.
+
+        json_output=True turns on the server-side JSON response mode, so
+        the model decodes straight into the requested structure without
+        markdown fences or prose around it.
+
+        Throttles and transient server errors are retried in place with
+        jittered exponential backoff (re-acquiring the rate buckets each
+        attempt), so callers' own retry loops never hammer the endpoint
+        with identical prompts back to back. Permanent errors still raise
+        immediately.
+        """
+        config = genai.GenerationConfig(response_mime_type="application/json") if json_output else None
+        for attempt in range(GENERATION_MAX_ATTEMPTS):
+            if attempt:
+                delay = min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+                time.sleep(delay + random.uniform(0, delay))
+            # Pace against both quota dimensions before taking a concurrency
+            # slot, so a rate-limited caller sleeps without blocking others.
+            # Token estimate uses the ~4-chars-per-token heuristic.
+            _REQUEST_BUCKET.acquire()
+            _PROMPT_TOKEN_BUCKET.acquire(len(prompt) // 4 + 1)
+            try:
+                with _GENERATION_GATE:
+                    if self._cached_model is not None:
+                        response = self._cached_model.generate_content(prompt, generation_config=config)
+                    else:
+                        response = self.model.generate_content(
+                            f"{INTERVIEWER_INSTRUCTIONS}\n\n{prompt}", generation_config=config
+                        )
+            except Exception as e:
+                if attempt == GENERATION_MAX_ATTEMPTS - 1 or not _is_transient_error(e):
+                    raise
+                logger.warning("Transient generation error (attempt %d/%d), backing off: %s",
+                               attempt + 1, GENERATION_MAX_ATTEMPTS, e)
+                continue
+            self._record_usage(response)
+            return response
+
+    def _record_usage(self, response):
+        """Accumulate token counts from a response's usage_metadata."""
+        self.metrics["requests"] += 1
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        self.metrics["prompt_tokens"] += getattr(usage, "prompt_token_count", 0) or 0
+        self.metrics["cached_tokens"] += getattr(usage, "cached_content_token_count", 0) or 0
+        self.metrics["output_tokens"] += getattr(usage, "candidates_token_count", 0) or 0
+
+    def get_cache_stats(self) -> Dict:
+        """Get cumulative token accounting plus the cache hit ratio.
+
+        cached_ratio is the share of prompt tokens the server billed at
+        the cached rate - the closed-loop signal for tuning cache TTL and
+        prompt ordering.
+        """
+        prompt_tokens = self.metrics["prompt_tokens"]
+        return {
+            **self.metrics,
+            "cached_ratio": (self.metrics["cached_tokens"] / prompt_tokens) if prompt_tokens else 0.0,
+        }
+
     def analyze_candidate_profile(self) -> Dict:
         """Deeply analyze candidate profile to create personalized question strategy."""
         tech_stack = self.candidate_info.get("tech_stack", "")
         experience_years = self.candidate_info.get("experience_years", "0")
         desired_positions = self.candidate_info.get("desired_positions", "").lower()
-        
+
+        fingerprint = (tech_stack, experience_years, desired_positions)
+        cached = _PROFILE_ANALYSIS_CACHE.get(fingerprint)
+        if cached is not None:
+            self.candidate_profile = cached
+            return cached
+
         try:
             profile_analysis_prompt = f"""
             Analyze this candidate's profile in detail:
@@ -95,21 +550,22 @@ class TechnicalInterviewChatbot:
             }}
             """
             
-            response = self.model.generate_content(profile_analysis_prompt)
-            analysis = json.loads(response.text.strip())
+            response = self.generate(profile_analysis_prompt, json_output=True)
+            analysis = json.loads(response.text)
             
             # Store the analysis
             self.candidate_profile = analysis
+            _PROFILE_ANALYSIS_CACHE[fingerprint] = analysis
             return analysis
             
         except Exception as e:
-            print(f"Error analyzing candidate profile: {e}")
+            logger.warning("Error analyzing candidate profile: %s", e)
             # Fallback analysis
             return {
                 "primary_technologies": tech_stack.split(',')[:3],
                 "experience_level_per_tech": {},
                 "position_category": "fullstack",
-                "complexity_level": self.get_experience_level(experience_years),
+                "complexity_level": self.experience_level,
                 "interview_approach": "scenario-based"
             }
     
@@ -124,34 +580,37 @@ class TechnicalInterviewChatbot:
                 "engagement_level": "Not Available"
             }
         
+        # Identical response text always yields the same analysis, so serve
+        # repeats from the process-wide cache instead of re-calling the
+        # model - across sessions too, not just within one interview.
+        cached = _SENTIMENT_RESULT_CACHE.get(response_text)
+        if cached is not None:
+            return cached
+
         try:
             # Use the sentiment analyzer
             sentiment_result = self.sentiment_analyzer.analyze_sentiment(response_text)
-            
+
             if sentiment_result and isinstance(sentiment_result, dict):
+                _SENTIMENT_RESULT_CACHE[response_text] = sentiment_result
                 return sentiment_result
             else:
                 # Fallback analysis using simple keyword detection
                 return self.fallback_sentiment_analysis(response_text)
-                
+
         except Exception as e:
-            print(f"Error in sentiment analysis: {e}")
+            logger.warning("Error in sentiment analysis: %s", e)
             return self.fallback_sentiment_analysis(response_text)
     
     def fallback_sentiment_analysis(self, text: str) -> Dict:
         """Fallback sentiment analysis using keyword detection."""
         text_lower = text.lower()
-        
-        # Confidence indicators
-        confident_words = ["definitely", "certainly", "absolutely", "sure", "confident", "know", "experienced"]
-        uncertain_words = ["maybe", "perhaps", "think", "believe", "probably", "not sure", "guess"]
-        
-        confident_count = sum(1 for word in confident_words if word in text_lower)
-        uncertain_count = sum(1 for word in uncertain_words if word in text_lower)
-        
-        # Technical depth indicators
-        technical_words = ["implement", "architecture", "database", "algorithm", "optimization", "framework", "api"]
-        technical_count = sum(1 for word in technical_words if word in text_lower)
+
+        # One compiled-alternation pass per category; counting distinct
+        # matches keeps parity with the old per-keyword membership tests
+        confident_count = len(set(_FALLBACK_SENTIMENT_PATTERNS["confident"].findall(text_lower)))
+        uncertain_count = len(set(_FALLBACK_SENTIMENT_PATTERNS["uncertain"].findall(text_lower)))
+        technical_count = len(set(_FALLBACK_SENTIMENT_PATTERNS["technical"].findall(text_lower)))
         
         # Determine overall sentiment
         if confident_count > uncertain_count:
@@ -191,13 +650,30 @@ class TechnicalInterviewChatbot:
         tech_stack = self.candidate_info.get("tech_stack", "")
         experience_years = self.candidate_info.get("experience_years", "0")
         desired_positions = self.candidate_info.get("desired_positions", "")
-        
+
+        # Normalized profile key: order-insensitive tech tokens plus level
+        # and position category, so "Python, React" and "react,python"
+        # profiles hit the same cache slot.
+        cache_key = (
+            self.experience_level,
+            profile.get('position_category', 'fullstack'),
+            tuple(sorted(self.get_tech_tokens())),
+        )
+        cached_question = _FIRST_QUESTION_CACHE.get(cache_key)
+        if cached_question and not self.is_question_duplicate(cached_question):
+            self.add_question_to_tracking(cached_question)
+            if profile.get('primary_technologies'):
+                self.technical_areas_covered.add(profile['primary_technologies'][0].lower())
+            return cached_question
+
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
+                # Static question-generation rules live in the cached system
+                # instruction; only the candidate-specific variables go here.
                 first_question_prompt = f"""
-                Generate a highly specific first technical question for this candidate:
-                
+                Generate the first technical question for this candidate:
+
                 CANDIDATE PROFILE:
                 - Tech Stack: {tech_stack}
                 - Experience: {experience_years} years
@@ -207,62 +683,53 @@ class TechnicalInterviewChatbot:
                 - Specialization Areas: {profile.get('specialization_areas', [])}
                 - Complexity Level: {profile.get('complexity_level', 'mid')}
                 - Interview Approach: {profile.get('interview_approach', 'scenario-based')}
-                
-                REQUIREMENTS:
-                1. Question must be SPECIFIC to their PRIMARY technology and target role
-                2. Must match their experience level complexity
-                3. Should be scenario-based and practical
-                4. Should allow for follow-up questions based on their answer
-                5. Must be relevant to real-world {desired_positions} challenges
-                6. Must be UNIQUE and not similar to any previously asked questions
-                
-                Generate ONE specific question that combines their primary technology, target role requirements, experience level complexity, and a realistic work scenario.
-                
-                Return ONLY the question, no additional text.
+
+                Combine their primary technology, target role requirements, and a realistic work scenario.
                 """
                 
-                response = self.model.generate_content(first_question_prompt)
+                response = self.generate(first_question_prompt)
                 question = response.text.strip()
                 
                 # Check if question is duplicate
                 if not self.is_question_duplicate(question):
                     # Add to tracking
                     self.add_question_to_tracking(question)
-                    
+
                     # Mark the primary technology as covered
                     if profile.get('primary_technologies'):
                         self.technical_areas_covered.add(profile['primary_technologies'][0].lower())
-                    
+
+                    _FIRST_QUESTION_CACHE[cache_key] = question
                     return question
                     
             except Exception as e:
-                print(f"Error generating first question (attempt {attempt + 1}): {e}")
+                logger.warning("Error generating first question (attempt %d): %s", attempt + 1, e)
         
         # Enhanced fallback based on profile
         primary_tech = tech_stack.split(',')[0].strip() if tech_stack else "programming"
-        experience_level = self.get_experience_level(experience_years)
-        
-        fallback_questions = {
-            "junior": f"Walk me through how you would build a simple {desired_positions} feature using {primary_tech}. What would be your step-by-step approach?",
-            "mid-level": f"You're tasked with optimizing a slow-performing {primary_tech} application in a {desired_positions} role. What's your debugging and optimization strategy?",
-            "senior": f"Design a scalable {primary_tech} solution for a {desired_positions} team handling 100k+ users. What architectural decisions would you make?",
-            "expert": f"You're leading a {desired_positions} team migrating from legacy {primary_tech} to modern stack. How do you plan and execute this transition?"
-        }
-    
-        fallback_question = fallback_questions.get(experience_level, fallback_questions["mid-level"])
+
+        template = _FALLBACK_FIRST_QUESTIONS.get(self.experience_level,
+                                                 _FALLBACK_FIRST_QUESTIONS["mid-level"])
+        fallback_question = template.format(tech=primary_tech, position=desired_positions)
         self.add_question_to_tracking(fallback_question)
         return fallback_question
 
-    def normalize_question(self, question: str) -> str:
-        """Normalize question for duplicate detection."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def normalize_question(question: str) -> str:
+        """Normalize question for duplicate detection.
+
+        Pure function of the raw text; the lru_cache means a question that
+        passes through tracking, duplicate checks, and the analysis cache
+        key is normalized once, not once per consumer.
+        """
         normalized = question.lower()
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        normalized = re.sub(r'[.!?]+$', '', normalized)
-        normalized = re.sub(r'\[q-\d+\]', '', normalized)
-        normalized = re.sub(r'question \d+:', '', normalized)
-        stop_words = ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']
+        normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+        normalized = _TRAILING_PUNCT_RE.sub('', normalized)
+        normalized = _QUESTION_TAG_RE.sub('', normalized)
+        normalized = _QUESTION_NUM_RE.sub('', normalized)
         words = normalized.split()
-        normalized = ' '.join([word for word in words if word not in stop_words])
+        normalized = ' '.join([word for word in words if word not in _STOP_WORDS])
         return normalized
 
     def get_conversation_state(self) -> Dict:
@@ -270,7 +737,8 @@ class TechnicalInterviewChatbot:
         return {
             "current_state": self.current_state,
             "candidate_info": self.candidate_info,
-            "questions_asked": len(self.responses),
+            "questions_asked": self.response_counters["total"],
+            "response_counters": dict(self.response_counters),
             "current_question_index": self.current_question_index,
             "tech_questions": self.tech_questions,
             "responses": self.responses,
@@ -278,12 +746,39 @@ class TechnicalInterviewChatbot:
             "skill_depth_assessment": self.skill_depth_assessment,
             "candidate_profile": self.candidate_profile,
             "progress_percentage": self.get_progress_percentage(),
-            "interview_completed": self.current_state == self.COMPLETED
+            "interview_completed": self.current_state == self.COMPLETED,
+            "generation_metrics": self.get_cache_stats()
         }
     
     def process_message(self, user_input: str) -> str:
         """Process user message and return chatbot response."""
         return self.process_input(user_input)
+    def process_message_stream(self, user_input: str, flush_interval: float = STREAM_FLUSH_INTERVAL):
+        """Yield the chatbot response in display-sized chunks.
+
+        Responses are composed from several model calls plus assessment
+        blocks, so the text cannot be surfaced straight off the wire; this
+        streams the composed reply line by line so the UI can render
+        progressively instead of blocking on the full string.
+
+        Chunks are buffered and flushed at most once per flush_interval
+        seconds (plus a final flush), so the UI rerender rate stays bounded
+        no matter how quickly chunks are produced.
+        """
+        response = self.process_input(user_input)
+        buffer = ""
+        # Zero, not now(): the first chunk should go out as soon as it
+        # exists instead of waiting out a full flush interval
+        last_flush = 0.0
+        for chunk in response.splitlines(keepends=True):
+            buffer += chunk
+            now = time.monotonic()
+            if now - last_flush >= flush_interval:
+                yield buffer
+                buffer = ""
+                last_flush = now
+        if buffer:
+            yield buffer
 
     def get_progress_percentage(self) -> int:
         """Calculate interview progress percentage."""
@@ -301,120 +796,184 @@ class TechnicalInterviewChatbot:
             return 0
     
     def is_question_duplicate(self, new_question: str) -> bool:
-        """Check if a question is duplicate or too similar to existing ones."""
+        """Check if a question is duplicate or too similar to existing ones.
+
+        Staged check over the token inverted index maintained by
+        add_question_to_tracking: a cheap length gate first, then Jaccard
+        over the posting-list candidate pool, and for borderline Jaccard
+        scores a SequenceMatcher confirmation (quick_ratio before the full
+        ratio), plus a character-trigram Jaccard pass for paraphrases whose
+        word bags diverge. Word-bag overlap alone is a weak signal near the
+        threshold; the extra checks catch rewordings it misses without
+        paying the O(N) cost of matching against every asked question.
+        """
         if not new_question or not new_question.strip():
             return True
+        # No separate exact-match set: an identical normalized question has
+        # an identical token set, so Stage 2 reports Jaccard 1.0 for it
         normalized_new = self.normalize_question(new_question)
-        if normalized_new in self.asked_questions:
-            return True
-        for existing_question in self.asked_questions:
-            similarity = self.calculate_question_similarity(normalized_new, existing_question)
-            if similarity > 0.8:
+        new_tokens = frozenset(normalized_new.split())
+        if not new_tokens:
+            return False
+        candidates = set()
+        for token in new_tokens:
+            candidates.update(self._token_postings.get(token, ()))
+        new_len = len(new_tokens)
+        new_char_len = len(normalized_new)
+        new_shingles = _char_trigrams(normalized_new) if candidates else frozenset()
+        for idx in candidates:
+            existing = self._normalized_questions[idx]
+            # Stage 1: questions whose lengths differ by more than half
+            # cannot be near-duplicates
+            if abs(new_char_len - len(existing)) / max(new_char_len, len(existing), 1) > 0.5:
+                continue
+            # Stage 2: Jaccard over the cached token sets
+            existing_tokens = self._question_token_sets[idx]
+            intersection = len(new_tokens & existing_tokens)
+            union = new_len + len(existing_tokens) - intersection
+            jaccard = intersection / union if union else 0.0
+            if jaccard > 0.8:
+                return True
+            # Stage 3: borderline word overlap -- confirm with the
+            # C-implemented sequence matcher before calling it a duplicate
+            if jaccard > 0.5:
+                matcher = difflib.SequenceMatcher(None, normalized_new, existing)
+                if matcher.quick_ratio() >= 0.8 and matcher.ratio() >= 0.8:
+                    return True
+            # Stage 4: character-trigram Jaccard catches paraphrases whose
+            # word bags diverge (synonym swaps keep most trigrams through
+            # the shared entities and phrasing)
+            existing_shingles = self._question_shingle_sets[idx]
+            shingle_union = len(new_shingles | existing_shingles)
+            if (shingle_union and
+                    len(new_shingles & existing_shingles) / shingle_union > TRIGRAM_SIMILARITY_THRESHOLD):
                 return True
         return False
 
     def calculate_question_similarity(self, question1: str, question2: str) -> float:
-        """Calculate similarity between two questions using simple word overlap."""
-        words1 = set(question1.split())
-        words2 = set(question2.split())
+        """Calculate word-overlap (Jaccard) similarity between two questions.
+
+        Diagnostic helper only: the duplicate-check hot path works directly
+        on the token frozensets cached by add_question_to_tracking and
+        never re-splits strings.
+        """
+        words1 = frozenset(question1.split())
+        words2 = frozenset(question2.split())
         if not words1 or not words2:
             return 0.0
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        similarity = len(intersection) / len(union) if union else 0.0
-        return similarity
+        return len(words1 & words2) / len(words1 | words2)
 
     def add_question_to_tracking(self, question: str):
-        """Add question to tracking sets."""
+        """Add question to the tracking ledger and the duplicate-check index."""
         if question and question.strip():
             normalized = self.normalize_question(question)
-            self.asked_questions.add(normalized)
             self.asked_questions_raw.append(question)
+            tokens = frozenset(normalized.split())
+            index = len(self._question_token_sets)
+            self._question_token_sets.append(tokens)
+            self._question_shingle_sets.append(_char_trigrams(normalized))
+            self._normalized_questions.append(normalized)
+            for token in tokens:
+                self._token_postings.setdefault(token, []).append(index)
 
     def get_question_uniqueness_constraint(self) -> str:
         """Get constraint text for AI prompts to avoid duplicate questions."""
         if not self.asked_questions_raw:
             return "This is the first question."
-        constraint = "PREVIOUSLY ASKED QUESTIONS (DO NOT repeat or create similar questions):\n"
-        for i, question in enumerate(self.asked_questions_raw, 1):
-            constraint += f"{i}. {question}\n"
-        constraint += "\nThe new question MUST be completely different from all above questions."
-        return constraint
-
-    def analyze_response_depth_and_generate_followup(self, question: str, answer: str) -> Tuple[str, bool, Dict]:
-        """Analyze response depth and generate targeted follow-up questions."""
+        listing = ''.join(f"{i}. {question}\n"
+                          for i, question in enumerate(self.asked_questions_raw, 1))
+        return ("PREVIOUSLY ASKED QUESTIONS (DO NOT repeat or create similar questions):\n"
+                + listing
+                + "\nThe new question MUST be completely different from all above questions.")
+
+    def analyze_response_depth_and_generate_followup(self, question: str, answer: str) -> Tuple[str, bool, Dict, str]:
+        """Analyze response depth and plan the next turn in one model call.
+
+        Returns (followup_question, needs_followup, analysis, next_question).
+        The answer analysis, follow-up decision, and candidate next main
+        question all come back from a single fused request, so each turn
+        costs one round trip instead of two sequential ones; the caller
+        branches locally on needs_followup.
+        """
         if answer.lower() == "skipped":
-            return "", False, {}
-        
+            return "", False, {}, ""
+
         profile = self.candidate_profile
         tech_stack = self.candidate_info.get("tech_stack", "")
         experience_years = self.candidate_info.get("experience_years", "0")
         desired_positions = self.candidate_info.get("desired_positions", "")
-        
+
+        # Check the generative cache first: an answer whose word set
+        # overlaps a cached answer for this question at or above the
+        # similarity threshold (Jaccard) reuses that analysis outright.
+        answer_words = frozenset(_WORD_RE.findall(answer.lower()))
+        cache_bucket = _ANSWER_ANALYSIS_CACHE.setdefault(self.normalize_question(question), [])
+        for cached_words, cached_analysis in cache_bucket:
+            union = answer_words | cached_words
+            if union and len(answer_words & cached_words) / len(union) >= ANSWER_SIMILARITY_THRESHOLD:
+                return self._finish_answer_analysis(question, dict(cached_analysis))
+
         try:
-            analysis_prompt = f"""
-            Analyze this candidate's technical response in detail:
-            
+            # Ordered for implicit prefix caching: the static JSON spec and
+            # per-session-stable candidate context come first, the per-turn
+            # Q&A and progress sections last, so each turn shares the
+            # longest possible verbatim prefix with the previous one.
+            analysis_prompt = _ANALYSIS_PROMPT_PREFIX + f"""
             CANDIDATE CONTEXT:
             - Tech Stack: {tech_stack}
-            - Experience: {experience_years} years  
+            - Experience: {experience_years} years
             - Target Role: {desired_positions}
             - Expected Complexity: {profile.get('complexity_level', 'mid')}
-            
+
             QUESTION: {question}
             ANSWER: {answer}
-            
+
             PREVIOUS RESPONSES CONTEXT: {len(self.responses)} questions asked so far
             AREAS ALREADY COVERED: {list(self.technical_areas_covered)}
-            
+            UNCOVERED TECHNOLOGIES: {self.get_uncovered_technologies()}
+
             AVOID DUPLICATE QUESTIONS:
             {self.get_question_uniqueness_constraint()}
-            
-            Provide detailed analysis in JSON format:
-            {{
-                "response_quality": "excellent/good/average/poor",
-                "technical_depth": "deep/moderate/shallow",
-                "knowledge_level_shown": "expert/advanced/intermediate/beginner",
-                "specific_strengths": ["list specific technical strengths shown"],
-                "knowledge_gaps": ["areas where knowledge seems limited"],
-                "follow_up_opportunities": ["specific areas to probe deeper"],
-                "buzzwords_vs_understanding": "genuine_understanding/surface_level/mixed",
-                "practical_experience_evident": true/false,
-                "needs_followup": true/false,
-                "followup_type": "clarification/deeper_dive/practical_application/edge_cases",
-                "suggested_followup": "specific follow-up question if needed - must be UNIQUE from all previous questions"
-            }}
             """
             
-            response = self.model.generate_content(analysis_prompt)
-            analysis = json.loads(response.text.strip())
-            
-            # Store skill assessment
-            question_tech = self.extract_technology_from_question(question)
-            if question_tech:
-                self.skill_depth_assessment[question_tech] = {
-                    "level": analysis.get("knowledge_level_shown", "intermediate"),
-                    "quality": analysis.get("response_quality", "average"),
-                    "depth": analysis.get("technical_depth", "moderate")
-                }
-            
-            followup_needed = analysis.get("needs_followup", False)
-            suggested_followup = analysis.get("suggested_followup", "")
-            
-            # Check if suggested follow-up is duplicate
-            if followup_needed and suggested_followup:
-                if not self.is_question_duplicate(suggested_followup):
-                    self.add_question_to_tracking(suggested_followup)
-                    return suggested_followup, True, analysis
-                else:
-                    # Generate alternative if suggested followup is duplicate
-                    return "", False, analysis
-            
-            return "", False, analysis
-            
+            response = self.generate(analysis_prompt, json_output=True)
+            analysis = json.loads(response.text)
+            cache_bucket.append((answer_words, dict(analysis)))
+
+            return self._finish_answer_analysis(question, analysis)
+
         except Exception as e:
-            print(f"Error analyzing response: {e}")
-            return "", False, {}
+            logger.warning("Error analyzing response: %s", e)
+            return "", False, {}, ""
+
+    def _finish_answer_analysis(self, question: str, analysis: Dict) -> Tuple[str, bool, Dict, str]:
+        """Apply a parsed (fresh or cached) answer analysis: record the
+        skill assessment and resolve the follow-up branch with the usual
+        duplicate checks."""
+        # Store skill assessment
+        question_tech = self.extract_technology_from_question(question)
+        if question_tech:
+            self.skill_depth_assessment[question_tech] = {
+                "level": analysis.get("knowledge_level_shown", "intermediate"),
+                "quality": analysis.get("response_quality", "average"),
+                "depth": analysis.get("technical_depth", "moderate")
+            }
+
+        followup_needed = analysis.get("needs_followup", False)
+        suggested_followup = analysis.get("suggested_followup", "")
+        next_question = analysis.get("next_question", "")
+
+        # Check if suggested follow-up is duplicate
+        if followup_needed and suggested_followup:
+            if not self.is_question_duplicate(suggested_followup):
+                self.add_question_to_tracking(suggested_followup)
+                return suggested_followup, True, analysis, next_question
+            else:
+                # Fall through to the next main question if the
+                # suggested follow-up duplicates an earlier one
+                return "", False, analysis, next_question
+
+        return "", False, analysis, next_question
 
     def generate_context_aware_next_question(self) -> str:
         """Generate next question based on comprehensive context analysis."""
@@ -429,16 +988,22 @@ class TechnicalInterviewChatbot:
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
+                # Like the first-question prompt, this carries only dynamic
+                # context; the generation rubric rides in the context cache.
+                # Per-session-stable sections lead and per-turn ones trail
+                # so consecutive turns share a long verbatim prefix for the
+                # server's implicit prefix cache.
                 next_question_prompt = f"""
-                Generate the next highly specific technical question based on comprehensive context:
-                
+                Generate the next technical question based on this context.
+                The question should address an uncovered technical area, match their demonstrated competency level, and be directly relevant to {desired_positions} work.
+
                 CANDIDATE PROFILE:
                 - Tech Stack: {tech_stack}
                 - Experience: {experience_years} years
                 - Target Role: {desired_positions}
                 - Position Category: {profile.get('position_category', 'fullstack')}
                 - Complexity Level: {profile.get('complexity_level', 'mid')}
-                
+
                 INTERVIEW PROGRESS:
                 - Questions Asked: {len(self.responses)}
                 - Technical Areas Covered: {list(self.technical_areas_covered)}
@@ -453,13 +1018,9 @@ class TechnicalInterviewChatbot:
                 
                 CRITICAL - AVOID DUPLICATE QUESTIONS:
                 {self.get_question_uniqueness_constraint()}
-                
-                Generate ONE highly specific question that addresses an uncovered technical area, matches their demonstrated competency level, is directly relevant to {desired_positions} work, allows assessment of practical experience, and is COMPLETELY UNIQUE from all previous questions.
-                
-                Return ONLY the question, no additional text.
                 """
                 
-                response = self.model.generate_content(next_question_prompt)
+                response = self.generate(next_question_prompt)
                 question = response.text.strip()
                 
                 # Check if question is duplicate
@@ -475,7 +1036,7 @@ class TechnicalInterviewChatbot:
                     return question
                     
             except Exception as e:
-                print(f"Error generating next question (attempt {attempt + 1}): {e}")
+                logger.warning("Error generating next question (attempt %d): %s", attempt + 1, e)
         
         # Fallback with uniqueness check
         return self.get_fallback_next_question()
@@ -485,8 +1046,9 @@ class TechnicalInterviewChatbot:
         if not self.responses:
             return {"pattern": "no_data"}
         
+        self._scan_response_indicators()
         patterns = {
-            "average_response_length": sum(len(r['answer']) for r in self.responses) / len(self.responses),
+            "average_response_length": self._response_len_sum / len(self.responses),
             "theoretical_vs_practical": self.assess_theoretical_vs_practical(),
             "confidence_indicators": self.count_confidence_indicators(),
             "technology_mentions": self.count_technology_mentions(),
@@ -495,101 +1057,187 @@ class TechnicalInterviewChatbot:
         
         return patterns
     
+    def _scan_response_indicators(self) -> Dict[str, int]:
+        """Count indicator-phrase hits per category across all responses.
+
+        Responses are append-only, so the counts are kept as running totals:
+        each call scans only the answers added since the last call, making
+        the per-turn cost constant instead of growing with interview length.
+        Each new answer is lowercased once and scanned with the precompiled
+        category alternations; distinct-phrase counting per response keeps
+        parity with the old per-phrase membership tests. A running length
+        sum is maintained alongside for the average-length stat.
+        """
+        for response in self.responses[self._indicator_scanned:]:
+            answer_lower = response.answer.lower()
+            for category, pattern in _INDICATOR_PATTERNS.items():
+                self._indicator_counts[category] += len(set(pattern.findall(answer_lower)))
+            self._response_len_sum += len(response.answer)
+        self._indicator_scanned = len(self.responses)
+        return self._indicator_counts
+
     def assess_theoretical_vs_practical(self) -> str:
         """Assess if candidate gives theoretical or practical answers."""
-        practical_indicators = ["project", "implemented", "built", "deployed", "used", "worked with", "experience"]
-        theoretical_indicators = ["should", "would", "could", "theory", "concept", "generally", "typically"]
-        
-        practical_count = 0
-        theoretical_count = 0
-        
-        for response in self.responses:
-            answer_lower = response['answer'].lower()
-            practical_count += sum(1 for indicator in practical_indicators if indicator in answer_lower)
-            theoretical_count += sum(1 for indicator in theoretical_indicators if indicator in answer_lower)
-        
+        counts = self._scan_response_indicators()
+        practical_count = counts["practical"]
+        theoretical_count = counts["theoretical"]
+
         if practical_count > theoretical_count * 1.5:
             return "practical_focused"
         elif theoretical_count > practical_count * 1.5:
             return "theoretical_focused"
         else:
             return "balanced"
-    
+
     def count_confidence_indicators(self) -> Dict:
         """Count indicators of confidence in responses."""
-        confident_phrases = ["I have", "I've done", "I built", "I implemented", "I led", "I designed"]
-        uncertain_phrases = ["I think", "maybe", "probably", "I'm not sure", "I believe", "I guess"]
-        
-        confident_count = 0
-        uncertain_count = 0
-        
-        for response in self.responses:
-            answer_lower = response['answer'].lower()
-            confident_count += sum(1 for phrase in confident_phrases if phrase in answer_lower)
-            uncertain_count += sum(1 for phrase in uncertain_phrases if phrase in answer_lower)
-        
+        counts = self._scan_response_indicators()
+        confident_count = counts["confident"]
+        uncertain_count = counts["uncertain"]
+
         return {
             "confident_indicators": confident_count,
             "uncertain_indicators": uncertain_count,
             "confidence_ratio": confident_count / max(uncertain_count, 1)
         }
     
+    def get_tech_pattern(self) -> Optional[re.Pattern]:
+        """Get a compiled alternation over the candidate's tech stack.
+
+        Compiled once per tech_stack value, so scanning a question or answer
+        for any known technology is a single C-level regex pass instead of
+        one substring scan per technology.
+        """
+        tech_stack = self.candidate_info.get("tech_stack", "")
+        if tech_stack != self._tech_pattern_source:
+            self._tech_tokens = [t.strip().lower() for t in tech_stack.split(',') if t.strip()]
+            techs = [re.escape(t) for t in self._tech_tokens]
+            self._tech_pattern_compiled = re.compile('|'.join(techs)) if techs else None
+            self._tech_pattern_source = tech_stack
+        return self._tech_pattern_compiled
+
+    def get_tech_tokens(self) -> List[str]:
+        """Get the candidate's normalized tech-stack tokens.
+
+        Split/strip/lower runs only when the stack string changes (shared
+        with the pattern cache above); every other call returns the cached
+        list.
+        """
+        self.get_tech_pattern()
+        return self._tech_tokens
+
     def count_technology_mentions(self) -> Dict:
         """Count specific technology mentions in responses."""
-        tech_mentions = {}
-        tech_list = [t.strip().lower() for t in self.candidate_info.get("tech_stack", "").split(',')]
-        
+        pattern = self.get_tech_pattern()
+        if not pattern:
+            return {}
+
+        tech_mentions = Counter()
         for response in self.responses:
-            answer_lower = response['answer'].lower()
-            for tech in tech_list:
-                if tech in answer_lower:
-                    tech_mentions[tech] = tech_mentions.get(tech, 0) + 1
-        
-        return tech_mentions
+            # Count each tech at most once per response, matching the old
+            # substring-scan behavior
+            tech_mentions.update({m.group(0) for m in pattern.finditer(response.answer.lower())})
+
+        return dict(tech_mentions)
     
     def count_experience_indicators(self) -> Dict:
         """Count indicators of real-world experience."""
-        experience_indicators = {
-            "project_work": ["project", "application", "system", "platform"],
-            "team_work": ["team", "collaborated", "worked with", "led", "managed"],
-            "problem_solving": ["problem", "issue", "bug", "fixed", "solved", "optimized"],
-            "production": ["production", "deployed", "live", "users", "scale"]
-        }
-        
-        indicator_counts = {category: 0 for category in experience_indicators}
-        
-        for response in self.responses:
-            answer_lower = response['answer'].lower()
-            for category, indicators in experience_indicators.items():
-                indicator_counts[category] += sum(1 for indicator in indicators if indicator in answer_lower)
-        
-        return indicator_counts
+        counts = self._scan_response_indicators()
+        return {category: counts[category]
+                for category in ("project_work", "team_work", "problem_solving", "production")}
     
     def get_uncovered_technologies(self) -> List[str]:
-        """Get technologies from their stack that haven't been covered yet."""
-        tech_list = [t.strip().lower() for t in self.candidate_info.get("tech_stack", "").split(',')]
-        return [tech for tech in tech_list if tech not in self.technical_areas_covered]
+        """Get technologies from their stack that haven't been covered yet.
+
+        Memoized on (tech stack, covered-area count): the covered set is
+        add-only, so the result can only change when its size does. The
+        several prompt builders that ask per turn share one computation.
+        """
+        key = (self.candidate_info.get("tech_stack", ""), len(self.technical_areas_covered))
+        if self._uncovered_cache is None or self._uncovered_cache[0] != key:
+            uncovered = [tech for tech in self.get_tech_tokens()
+                         if tech not in self.technical_areas_covered]
+            self._uncovered_cache = (key, uncovered)
+        return self._uncovered_cache[1]
     
     def extract_technology_from_question(self, question: str) -> Optional[str]:
         """Extract the primary technology being asked about from the question."""
-        tech_list = [t.strip().lower() for t in self.candidate_info.get("tech_stack", "").split(',')]
-        question_lower = question.lower()
-        
-        for tech in tech_list:
-            if tech in question_lower:
-                return tech
-        return None
+        pattern = self.get_tech_pattern()
+        if not pattern:
+            return None
+        match = pattern.search(question.lower())
+        return match.group(0) if match else None
     
+    def _maybe_summarize_history(self):
+        """Fold older Q&A into a rolling summary so prompt context stays
+        bounded as the interview grows.
+
+        Keeps the last two responses verbatim for get_recent_qa_context and
+        summarizes everything older in one cheap call, carrying forward the
+        previous summary. No-op below HISTORY_SUMMARY_THRESHOLD responses
+        (the default question cap stays under it, so this only kicks in for
+        longer configurations).
+        """
+        if len(self.responses) < HISTORY_SUMMARY_THRESHOLD:
+            return
+        fold = self.responses[self._summarized_upto:-2]
+        if not fold:
+            return
+
+        transcript = "\n".join(
+            f"Q: {r.question}\nA: {r.answer[:300]}" for r in fold
+        )
+        try:
+            summary_prompt = f"""
+            Maintain a running summary of a technical interview. Merge the
+            previous summary with the new exchanges into a concise update
+            (under 150 words) covering topics asked, answer quality, and
+            demonstrated strengths/gaps.
+
+            PREVIOUS SUMMARY:
+            {self.history_summary or "None yet"}
+
+            NEW EXCHANGES:
+            {transcript}
+            """
+            response = self.generate(summary_prompt)
+            self.history_summary = response.text.strip()
+            self._summarized_upto = len(self.responses) - 2
+        except Exception as e:
+            logger.warning("Error summarizing history: %s", e)
+
+    def _pack_recent_responses(self, budget: int = QA_CONTEXT_TOKEN_BUDGET) -> List['ResponseEntry']:
+        """Pack unsummarized responses newest-first into a token budget.
+
+        A fixed slice either blows the prefill budget on long answers or
+        wastes context headroom on short ones; greedy packing against an
+        estimated token ceiling (4 chars per token) keeps prompt prefill
+        bounded and deterministic while using the room that exists.
+        """
+        packed = []
+        used = 0
+        for response in reversed(self.responses[self._summarized_upto:]):
+            tokens = (len(response.question) + len(response.answer)) // 4
+            if packed and used + tokens > budget:
+                break
+            packed.append(response)
+            used += tokens
+        packed.reverse()
+        return packed
+
     def get_recent_qa_context(self) -> str:
-        """Get context from recent Q&A pairs."""
-        if len(self.responses) < 2:
+        """Get context from recent Q&A pairs, packed to a token budget,
+        plus the rolling summary of anything older."""
+        if not self.responses:
             return "Limited context available"
-        
-        recent_responses = self.responses[-2:]
+
         context = ""
-        for i, response in enumerate(recent_responses, 1):
-            context += f"Q{i}: {response['question']}\nA{i}: {response['answer'][:200]}...\n\n"
-        
+        if self.history_summary:
+            context += f"EARLIER INTERVIEW SUMMARY:\n{self.history_summary}\n\n"
+
+        for i, response in enumerate(self._pack_recent_responses(), 1):
+            context += f"Q{i}: {response.question}\nA{i}: {response.answer[:200]}...\n\n"
+
         return context
     
     def get_position_specific_focus_areas(self, position: str) -> str:
@@ -616,24 +1264,17 @@ class TechnicalInterviewChatbot:
         """Generate fallback question when AI generation fails."""
         uncovered_techs = self.get_uncovered_technologies()
         desired_positions = self.candidate_info.get("desired_positions", "developer")
-        
-        # Try different fallback approaches
-        fallback_templates = [
-            f"Tell me about a challenging problem you solved using {uncovered_techs[0] if uncovered_techs else 'your preferred technology'} in the context of {desired_positions} work. What was your approach?",
-            f"Describe the most complex {desired_positions} project you've worked on. What technical challenges did you face and how did you overcome them?",
-            f"How do you approach code reviews and quality assurance in {desired_positions} projects?",
-            f"What's your experience with testing strategies in {desired_positions} development?",
-            f"How do you handle performance optimization in your {desired_positions} work?"
-        ]
-        
-        # Find a unique fallback question
-        for template in fallback_templates:
-            if not self.is_question_duplicate(template):
-                self.add_question_to_tracking(template)
-                return template
+        tech = uncovered_techs[0] if uncovered_techs else "your preferred technology"
+
+        # Try different fallback approaches, rendering each template only
+        # when it is actually considered
+        for template in _FALLBACK_NEXT_TEMPLATES:
+            question = template.format(tech=tech, position=desired_positions)
+            if not self.is_question_duplicate(question):
+                self.add_question_to_tracking(question)
+                return question
         
         # Last resort - generate a timestamp-based unique question
-        import time
         unique_question = f"Based on your {desired_positions} experience, describe a recent technical decision you made and why you chose that approach. [Q-{int(time.time())}]"
         self.add_question_to_tracking(unique_question)
         return unique_question
@@ -656,9 +1297,15 @@ May I have your full name?"""
     
     def start_technical_questions(self) -> str:
         """Start the technical questions phase with enhanced personalization."""
-        # Analyze candidate profile comprehensively
+        # Candidate info is now complete. The context-cache upload and the
+        # profile analysis are independent round trips, so run the upload
+        # in the background while the analysis goes out on the plain model
+        # (generate() falls back transparently until the cache lands), and
+        # join before the first question so it benefits from the cache.
+        cache_future = self._executor.submit(self.ensure_context_cache)
         self.analyze_candidate_profile()
-        
+        cache_future.result()
+
         # Generate highly personalized first question
         first_question = self.generate_personalized_first_question()
         self.tech_questions = [first_question]
@@ -675,7 +1322,7 @@ Perfect! I have all your information and have analyzed your profile.
 **Personalized Interview Strategy:**
 - **Target Role:** {desired_positions}
 - **Tech Stack:** {tech_stack}
-- **Experience Level:** {self.get_experience_level(experience_years).title()}
+- **Experience Level:** {self.experience_level.title()}
 - **Question Approach:** {self.candidate_profile.get('interview_approach', 'scenario-based').title()}
 
 I've tailored questions specifically for your background and career goals. Each question will build on your previous responses.
@@ -689,21 +1336,45 @@ Please provide a detailed answer. You can type 'skip' if you'd like to move to t
     def handle_technical_questions(self, user_input: str) -> str:
         """Handle technical questions phase with enhanced context awareness and sentiment analysis."""
         current_question = self.tech_questions[self.current_question_index]
-        
-        # Analyze sentiment of current response
-        current_sentiment = self.analyze_response_sentiment(user_input)
-        
-        # Store the response with sentiment
-        response_entry = {
-            "question": current_question,
-            "answer": user_input if user_input.lower() != 'skip' else "Skipped",
-            "question_number": len(self.responses) + 1,
-            "timestamp": datetime.now().isoformat(),
-            "sentiment_analysis": current_sentiment
-        }
+
+        # Sentiment analysis is independent of follow-up/next-question
+        # generation, so run it in the background and let the two model
+        # calls overlap instead of executing back-to-back.
+        sentiment_future = self._executor.submit(self.analyze_response_sentiment, user_input)
+
+        # Store the response; sentiment is filled in once the future resolves
+        response_entry = ResponseEntry(
+            question=current_question,
+            answer=user_input if user_input.lower() != 'skip' else "Skipped",
+            question_number=len(self.responses) + 1,
+            timestamp=datetime.now().isoformat(timespec='seconds'),
+        )
         self.responses.append(response_entry)
+
+        # Keep counters in sync at append time
+        self.response_counters["total"] += 1
+        if response_entry.answer == "Skipped":
+            self.response_counters["skipped"] += 1
+        else:
+            self.response_counters["answered"] += 1
+
+        # Keep the prompt context bounded for long interviews
+        self._maybe_summarize_history()
+
+        # Fused response analysis: one model call returns the answer
+        # assessment, the follow-up decision, and a candidate next main
+        # question (runs on the main thread while sentiment is in flight)
+        followup_question, needs_followup, analysis, next_question = "", False, {}, ""
+        if user_input.lower() != 'skip' and len(self.responses) <= 6:
+            followup_question, needs_followup, analysis, next_question = self.analyze_response_depth_and_generate_followup(
+                current_question, user_input
+            )
+
+        # Collect the background sentiment result
+        current_sentiment = sentiment_future.result()
+        response_entry.sentiment_analysis = current_sentiment
         self.individual_sentiments.append(current_sentiment)
-        
+
         # Format sentiment analysis for display
         response_sentiment = ""
         if user_input.lower() != 'skip' and current_sentiment:
@@ -714,19 +1385,13 @@ Please provide a detailed answer. You can type 'skip' if you'd like to move to t
 - **Technical Depth:** {current_sentiment.get('technical_depth', 'Good')}
 - **Engagement:** {current_sentiment.get('engagement_level', 'Good')}
             """
-        
-        # Enhanced response analysis and follow-up generation
-        if user_input.lower() != 'skip' and len(self.responses) <= 6:
-            followup_question, needs_followup, analysis = self.analyze_response_depth_and_generate_followup(
-                current_question, user_input
-            )
-            
-            if needs_followup and followup_question:
-                self.tech_questions.append(followup_question)
-                self.current_question_index += 1
-                
-                return f"""
-Thank you for your detailed response! 
+
+        if needs_followup and followup_question:
+            self.tech_questions.append(followup_question)
+            self.current_question_index += 1
+
+            return f"""
+Thank you for your detailed response!
 
 **Technical Assessment:** {analysis.get('response_quality', 'Good').title()} quality response showing {analysis.get('technical_depth', 'moderate')} technical depth.
 
@@ -734,11 +1399,20 @@ Thank you for your detailed response!
 
 **Follow-up Question:**
 {followup_question}
-                """
+            """
         
         # Check if we should continue with more questions
         if len(self.responses) < 7:  # Continue for up to 7 questions
-            next_question = self.generate_context_aware_next_question()
+            # Prefer the next question from the fused call; only fall back
+            # to a dedicated generation round trip when it's missing,
+            # duplicated, or the answer was skipped.
+            if next_question and not self.is_question_duplicate(next_question):
+                self.add_question_to_tracking(next_question)
+                new_tech = self.extract_technology_from_question(next_question)
+                if new_tech:
+                    self.technical_areas_covered.add(new_tech.lower())
+            else:
+                next_question = self.generate_context_aware_next_question()
             self.tech_questions.append(next_question)
             self.current_question_index += 1
             
@@ -785,29 +1459,25 @@ Good luck with your job search! 🚀
             return {"overall": "No responses to analyze"}
         
         try:
-            overall_prompt = f"""
-            Analyze the overall interview performance based on individual response sentiments:
-            
-            Individual Response Sentiments: {json.dumps(self.individual_sentiments, indent=2)}
-            
-            Provide overall assessment in JSON format:
-            {{
-                "overall_confidence": "high/medium/low",
-                "technical_competency": "excellent/good/average/needs_improvement",
-                "communication_clarity": "excellent/good/average/poor",
-                "interview_performance": "strong/satisfactory/weak",
-                "key_strengths": ["list main strengths"],
-                "areas_for_improvement": ["list improvement areas"],
-                "hiring_recommendation": "strong_yes/yes/maybe/no",
-                "summary": "brief overall summary"
-            }}
-            """
-            
-            response = self.model.generate_content(overall_prompt)
-            return json.loads(response.text.strip())
+            # Compact separators: the model doesn't need pretty-printing,
+            # and the dump is the only dynamic part of this prompt. Repeat
+            # report generations reuse the cached serialization.
+            cached = self._sentiments_json_cache
+            if cached is None or cached[0] != len(self.individual_sentiments):
+                cached = (len(self.individual_sentiments),
+                          json.dumps(self.individual_sentiments, separators=(',', ':')))
+                self._sentiments_json_cache = cached
+            overall_prompt = "".join((
+                _OVERALL_PROMPT_PREFIX,
+                cached[1],
+                _OVERALL_PROMPT_SUFFIX,
+            ))
+
+            response = self.generate(overall_prompt, json_output=True)
+            return json.loads(response.text)
             
         except Exception as e:
-            print(f"Error in overall sentiment analysis: {e}")
+            logger.warning("Error in overall sentiment analysis: %s", e)
             return {"overall": "Analysis error", "summary": "Unable to complete analysis"}
     
     def generate_comprehensive_assessment(self) -> str:
@@ -816,70 +1486,84 @@ Good luck with your job search! 🚀
         tech_stack = self.candidate_info.get("tech_stack", "")
         experience_years = self.candidate_info.get("experience_years", "0")
         desired_positions = self.candidate_info.get("desired_positions", "")
+        # Direct field formatting skips strftime's format-string parsing
+        now = datetime.now()
+        interview_date = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
         
-        report = f"""
+        # Accumulate sections in a list and join once: += on a growing
+        # report string reallocates the whole buffer every append
+        parts = [f"""
 📋 **TECHNICAL INTERVIEW ASSESSMENT REPORT**
 
 **Candidate:** {candidate_name}
 **Target Role:** {desired_positions}
 **Experience:** {experience_years} years
 **Tech Stack:** {tech_stack}
-**Interview Date:** {datetime.now().strftime('%Y-%m-%d')}
+**Interview Date:** {interview_date}
 
 **📊 OVERALL PERFORMANCE:**
-"""
-        
-        if self.sentiment_analysis:
-            report += f"""
-- **Technical Competency:** {self.sentiment_analysis.get('technical_competency', 'Good').title()}
-- **Communication:** {self.sentiment_analysis.get('communication_clarity', 'Good').title()}
-- **Confidence Level:** {self.sentiment_analysis.get('overall_confidence', 'Medium').title()}
-- **Interview Performance:** {self.sentiment_analysis.get('interview_performance', 'Satisfactory').title()}
+"""]
+
+        # Bind the analysis dict once; the section below reads it ~10 times
+        overall = self.sentiment_analysis
+        if overall:
+            parts.append(f"""
+- **Technical Competency:** {overall.get('technical_competency', 'Good').title()}
+- **Communication:** {overall.get('communication_clarity', 'Good').title()}
+- **Confidence Level:** {overall.get('overall_confidence', 'Medium').title()}
+- **Interview Performance:** {overall.get('interview_performance', 'Satisfactory').title()}
 
 **💪 KEY STRENGTHS:**
-"""
-            for strength in self.sentiment_analysis.get('key_strengths', []):
-                report += f"- {strength}\n"
-            
-            report += f"""
+""")
+            for strength in overall.get('key_strengths', []):
+                parts.append(f"- {strength}\n")
+
+            parts.append("""
 **🎯 AREAS FOR IMPROVEMENT:**
-"""
-            for improvement in self.sentiment_analysis.get('areas_for_improvement', []):
-                report += f"- {improvement}\n"
-            
-            report += f"""
-**🏆 HIRING RECOMMENDATION:** {self.sentiment_analysis.get('hiring_recommendation', 'Maybe').replace('_', ' ').title()}
+""")
+            for improvement in overall.get('areas_for_improvement', []):
+                parts.append(f"- {improvement}\n")
+
+            parts.append(f"""
+**🏆 HIRING RECOMMENDATION:** {overall.get('hiring_recommendation', 'Maybe').replace('_', ' ').title()}
 
 **📝 SUMMARY:**
-{self.sentiment_analysis.get('summary', 'Candidate showed reasonable technical knowledge and communication skills.')}
-"""
-        
+{overall.get('summary', 'Candidate showed reasonable technical knowledge and communication skills.')}
+""")
+
         # Add technical areas assessment
         if self.skill_depth_assessment:
-            report += f"""
+            parts.append("""
 
 **🔧 TECHNICAL SKILLS ASSESSMENT:**
-"""
+""")
             for tech, assessment in self.skill_depth_assessment.items():
-                report += f"- **{tech.title()}:** {assessment['level'].title()} level ({assessment['quality']} quality responses)\n"
-        
-        report += f"""
+                parts.append(f"- **{tech.title()}:** {assessment['level'].title()} level ({assessment['quality']} quality responses)\n")
+
+        parts.append("""
 
 **📈 DETAILED QUESTION ANALYSIS:**
-"""
+""")
         for i, response in enumerate(self.responses, 1):
-            sentiment = response.get('sentiment_analysis', {})
-            report += f"""
-**Q{i}:** {response['question'][:100]}...
+            sentiment = response.sentiment_analysis or {}
+            parts.append(f"""
+**Q{i}:** {response.question[:100]}...
 **Response Quality:** {sentiment.get('technical_depth', 'Good')}
 **Confidence:** {sentiment.get('confidence_indicators', 'Moderate')}
 ---
-"""
-        
-        return report
+""")
+
+        return "".join(parts)
     
-    def get_experience_level(self, years: str) -> str:
-        """Convert years of experience to level category."""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def get_experience_level(years: str) -> str:
+        """Convert years of experience to level category.
+
+        Pure function of the input string, so repeat calls (status bar,
+        sidebar, prompt builders all ask per turn) hit the lru_cache
+        instead of re-parsing the int.
+        """
         try:
             years_int = int(years)
             if years_int <= 2:
@@ -901,42 +1585,50 @@ Good luck with your job search! 🚀
         if user_input.lower() in self.exit_keywords:
             return "Thank you for using TechHire AI Interview Assistant! Goodbye! 👋"
         
-        if self.current_state == self.GREETING:
-            return self.handle_greeting(user_input)
-        elif self.current_state == self.COLLECTING_INFO:
-            return self.handle_info_collection(user_input)
-        elif self.current_state == self.TECHNICAL_QUESTIONS:
-            return self.handle_technical_questions(user_input)
-        elif self.current_state == self.COMPLETED:
+        if self.current_state == self.COMPLETED:
             return "Interview completed! Thank you for your participation. Type 'exit' to end."
-        
+
+        handler = self._state_handlers.get(self.current_state)
+        if handler is not None:
+            return handler(user_input)
+
         return "I'm not sure how to help with that. Please try again."
     
     def handle_greeting(self, user_input: str) -> str:
         """Handle the greeting phase."""
         self.candidate_info["full_name"] = user_input
+        self.info_version += 1
         self.current_state = self.COLLECTING_INFO
         return f"Nice to meet you, {user_input}! What's your email address?"
     
+    # Collected field -> prompt for the next one; defined once at class
+    # level instead of being rebuilt on every info-collection turn
+    FIELD_PROMPTS = {
+        "email": "What's your phone number?",
+        "phone": "How many years of professional experience do you have?",
+        "experience_years": "What positions are you targeting? (e.g., Frontend Developer, Backend Engineer, etc.)",
+        "desired_positions": "What's your preferred location or work arrangement?",
+        "location": "Please list your technical skills and technologies (comma-separated):"
+    }
+    FIELD_ORDER = tuple(FIELD_PROMPTS)
+
     def handle_info_collection(self, user_input: str) -> str:
         """Handle information collection phase."""
-        field_prompts = {
-            "email": "What's your phone number?",
-            "phone": "How many years of professional experience do you have?",
-            "experience_years": "What positions are you targeting? (e.g., Frontend Developer, Backend Engineer, etc.)",
-            "desired_positions": "What's your preferred location or work arrangement?",
-            "location": "Please list your technical skills and technologies (comma-separated):"
-        }
-        
-        current_field = list(field_prompts.keys())[self.current_field_index - 1] if self.current_field_index > 0 else "email"
+        field_prompts = self.FIELD_PROMPTS
+
+        current_field = self.FIELD_ORDER[self.current_field_index - 1] if self.current_field_index > 0 else "email"
         self.candidate_info[current_field] = user_input
-        
+        self.info_version += 1
+        if current_field == "experience_years":
+            self.experience_level = self.get_experience_level(user_input)
+
         self.current_field_index += 1
-        
+
         if self.current_field_index < len(field_prompts):
-            next_field = list(field_prompts.keys())[self.current_field_index - 1]
+            next_field = self.FIELD_ORDER[self.current_field_index - 1]
             return field_prompts[next_field]
         else:
             # Store tech stack and start technical questions
             self.candidate_info["tech_stack"] = user_input
+            self.info_version += 1
             return self.start_technical_questions()
\ No newline at end of file
@@ -1,8 +1,79 @@
-import google.generativeai as genai
-from typing import Dict, List, Tuple
-import statistics
+import logging
+from collections import Counter
+from typing import Dict, List
 import json
-from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Report skeleton rendered with a single format_map call; the insights
+# and trend sections are pre-joined blocks so no per-line concatenation
+# happens while formatting.
+_REPORT_TEMPLATE = """
+### 📊 Sentiment Analysis Report {for_name}
+
+#### Overall Assessment
+- **Primary Sentiment:** {overall_sentiment}
+- **Confidence Level:** {confidence_pct:.1f}%
+- **Emotional Tone:** {emotional_tone}
+- **Engagement Level:** {engagement_level}
+
+#### Response Statistics
+- **Total Questions:** {total_responses}
+- **Responses Analyzed:** {analyzed_responses}
+- **Questions Skipped:** {skipped_responses}
+
+#### Sentiment Distribution
+- **Positive Responses:** {positive_pct:.1f}%
+- **Neutral Responses:** {neutral_pct:.1f}%
+- **Negative Responses:** {negative_pct:.1f}%
+
+#### Key Insights
+{insights_block}{trend_block}"""
+
+# Allowed values and fallbacks for parsed analysis fields; frozensets
+# give O(1) membership and are built once instead of per validation
+_ANALYSIS_VALIDATORS = {
+    "sentiment": frozenset({"positive", "negative", "neutral"}),
+    "emotional_tone": frozenset({"confident", "uncertain", "enthusiastic", "nervous", "calm", "frustrated"}),
+    "engagement_level": frozenset({"high", "medium", "low"}),
+    "technical_confidence": frozenset({"high", "medium", "low", "unknown"}),
+}
+_ANALYSIS_DEFAULTS = {
+    "sentiment": "neutral",
+    "emotional_tone": "calm",
+    "engagement_level": "medium",
+    "technical_confidence": "unknown",
+}
+
+# Insight lookup tables for _generate_insights, built once instead of
+# per call; dict dispatch replaces the if/elif label chains
+_SENTIMENT_INSIGHTS = {
+    "positive": "😊 The candidate showed a positive attitude throughout the interview",
+    "negative": "😟 The candidate showed some signs of stress or negativity",
+}
+_NEUTRAL_SENTIMENT_INSIGHT = "😐 The candidate maintained a neutral tone throughout"
+
+_ENGAGEMENT_INSIGHTS = {
+    "high": "🚀 High engagement level - candidate was actively participating",
+    "low": "📉 Lower engagement detected - candidate might have been disinterested or overwhelmed",
+}
+
+_TONE_INSIGHTS = {
+    "confident": "💼 Candidate displayed strong self-assurance",
+    "enthusiastic": "⭐ Great enthusiasm and passion for technology",
+    "nervous": "😰 Some nervousness detected - normal for interview situations",
+    "frustrated": "😤 Signs of frustration - questions might have been too challenging",
+    "uncertain": "❓ Some uncertainty in responses - might need clearer questions",
+    "calm": "😌 Maintained calm and composed throughout"
+}
+
+_TREND_MESSAGES = {
+    "increasing": "📈 Confidence improved throughout the interview",
+    "decreasing": "📉 Confidence declined during the interview",
+    "stable": "➡️ Confidence remained consistent throughout",
+    "insufficient_data": "📊 Not enough data to determine confidence trend",
+    "no_data": "❌ No confidence trend data available"
+}
 
 class SentimentAnalyzer:
     def __init__(self, gemini_model):
@@ -46,26 +117,11 @@ class SentimentAnalyzer:
             """
             
             response = self.model.generate_content(prompt)
-            result = json.loads(response.text.strip())
-            
-            # Validate and set defaults
-            valid_sentiments = ["positive", "negative", "neutral"]
-            valid_tones = ["confident", "uncertain", "enthusiastic", "nervous", "calm", "frustrated"]
-            valid_levels = ["high", "medium", "low"]
-            
-            if result.get("sentiment") not in valid_sentiments:
-                result["sentiment"] = "neutral"
-            if result.get("emotional_tone") not in valid_tones:
-                result["emotional_tone"] = "calm"
-            if result.get("engagement_level") not in valid_levels:
-                result["engagement_level"] = "medium"
-            if result.get("technical_confidence") not in valid_levels + ["unknown"]:
-                result["technical_confidence"] = "unknown"
-            
-            return result
-            
+            result = json.loads(response.text)
+            return self._normalize_analysis(result)
+
         except Exception as e:
-            print(f"Error analyzing sentiment: {e}")
+            logger.warning("Error analyzing sentiment: %s", e)
             # Return default values
             return {
                 "sentiment": "neutral",
@@ -76,24 +132,88 @@ class SentimentAnalyzer:
                 "key_indicators": []
             }
     
+    def _normalize_analysis(self, result: Dict) -> Dict:
+        """Validate a parsed analysis dict, replacing out-of-range values
+        with safe defaults."""
+        for field, allowed in _ANALYSIS_VALIDATORS.items():
+            if result.get(field) not in allowed:
+                result[field] = _ANALYSIS_DEFAULTS[field]
+        if not isinstance(result.get("confidence"), (int, float)):
+            result["confidence"] = 0.5
+
+        return result
+
+    def _analyze_responses_batched(self, valid_responses: List[Dict]) -> List[Dict]:
+        """Analyze every response in one Gemini call.
+
+        One prompt carrying all Q/A pairs replaces a round trip per
+        response, so wall time is a single network latency regardless of
+        interview length. Raises on any parse/shape problem; the caller
+        falls back to per-response calls.
+        """
+        qa_block = "".join(
+            f"\nResponse {i}:\nQuestion: {r['question']}\nAnswer: {r['answer']}\n"
+            for i, r in enumerate(valid_responses, 1)
+        )
+
+        prompt = f"""
+        Analyze the sentiment and emotional tone of each of these technical interview responses.
+
+        For every response provide:
+        1. Overall sentiment (positive, negative, neutral)
+        2. Confidence level in the answer as a number between 0 and 1
+        3. Emotional tone (confident, uncertain, enthusiastic, nervous, calm, frustrated)
+        4. Engagement level (high, medium, low)
+        5. Technical confidence shown (high, medium, low, unknown)
+
+        Respond in this exact JSON format, with one entry per response in the same order:
+        {{
+            "analyses": [
+                {{
+                    "sentiment": "positive/negative/neutral",
+                    "confidence": 0.8,
+                    "emotional_tone": "confident/uncertain/enthusiastic/nervous/calm/frustrated",
+                    "engagement_level": "high/medium/low",
+                    "technical_confidence": "high/medium/low/unknown",
+                    "key_indicators": ["specific words or phrases that indicate sentiment"]
+                }}
+            ]
+        }}
+        {qa_block}
+        """
+
+        response = self.model.generate_content(prompt)
+        analyses = json.loads(response.text)["analyses"]
+        if len(analyses) != len(valid_responses):
+            raise ValueError(
+                f"Expected {len(valid_responses)} analyses, got {len(analyses)}"
+            )
+        return [self._normalize_analysis(analysis) for analysis in analyses]
+
     def analyze_all_responses(self, responses: List[Dict]) -> Dict:
         """Analyze sentiment across all responses and provide summary."""
         if not responses:
             return self._get_empty_analysis()
-        
+
         # Filter out skipped responses
         valid_responses = [r for r in responses if r['answer'].lower() != 'skipped']
-        
+
         if not valid_responses:
             return self._get_empty_analysis()
-        
-        # Analyze each response
-        individual_analyses = []
-        for response in valid_responses:
-            analysis = self.analyze_single_response(response['question'], response['answer'])
+
+        # One batched model call for the whole interview; fall back to the
+        # per-response loop only if the batched result can't be used
+        try:
+            individual_analyses = self._analyze_responses_batched(valid_responses)
+        except Exception as e:
+            logger.warning("Batched sentiment analysis failed, falling back to per-response calls: %s", e)
+            individual_analyses = [
+                self.analyze_single_response(r['question'], r['answer'])
+                for r in valid_responses
+            ]
+        for analysis, response in zip(individual_analyses, valid_responses):
             analysis['question_number'] = response.get('question_number', 0)
-            individual_analyses.append(analysis)
-        
+
         # Calculate overall statistics
         overall_analysis = self._calculate_overall_sentiment(individual_analyses)
         overall_analysis['individual_analyses'] = individual_analyses
@@ -108,33 +228,27 @@ class SentimentAnalyzer:
         if not analyses:
             return self._get_empty_analysis()
         
-        # Count sentiments
-        sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-        confidence_scores = []
-        engagement_levels = {"high": 0, "medium": 0, "low": 0}
-        technical_confidence_levels = {"high": 0, "medium": 0, "low": 0, "unknown": 0}
-        emotional_tones = {}
-        
-        for analysis in analyses:
-            sentiment_counts[analysis['sentiment']] += 1
-            confidence_scores.append(analysis['confidence'])
-            engagement_levels[analysis['engagement_level']] += 1
-            technical_confidence_levels[analysis['technical_confidence']] += 1
-            
-            tone = analysis['emotional_tone']
-            emotional_tones[tone] = emotional_tones.get(tone, 0) + 1
-        
-        # Calculate percentages
+        # Count categories with Counter's C-level update path; missing
+        # categories read as 0 without the get-default dance
+        sentiment_counts = Counter(a['sentiment'] for a in analyses)
+        engagement_levels = Counter(a['engagement_level'] for a in analyses)
+        technical_confidence_levels = Counter(a['technical_confidence'] for a in analyses)
+        emotional_tones = Counter(a['emotional_tone'] for a in analyses)
+        confidence_scores = [a['confidence'] for a in analyses]
+
+        # Calculate percentages (all three categories always present)
         total = len(analyses)
-        sentiment_percentages = {k: (v/total)*100 for k, v in sentiment_counts.items()}
-        
+        sentiment_percentages = {k: (sentiment_counts[k] / total) * 100
+                                 for k in ("positive", "negative", "neutral")}
+
         # Determine dominant patterns
-        dominant_sentiment = max(sentiment_counts, key=sentiment_counts.get)
-        dominant_engagement = max(engagement_levels, key=engagement_levels.get)
-        dominant_tone = max(emotional_tones, key=emotional_tones.get) if emotional_tones else "calm"
+        dominant_sentiment = sentiment_counts.most_common(1)[0][0]
+        dominant_engagement = engagement_levels.most_common(1)[0][0]
+        dominant_tone = emotional_tones.most_common(1)[0][0] if emotional_tones else "calm"
         
-        # Calculate average confidence
-        avg_confidence = statistics.mean(confidence_scores) if confidence_scores else 0.5
+        # Calculate average confidence; sum/len avoids statistics.mean's
+        # exact-arithmetic machinery, which is heavy for plain floats
+        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
         
         # Generate insights
         insights = self._generate_insights(
@@ -148,8 +262,9 @@ class SentimentAnalyzer:
             "average_confidence": round(avg_confidence, 2),
             "dominant_emotional_tone": dominant_tone,
             "dominant_engagement_level": dominant_engagement,
-            "emotional_tone_distribution": emotional_tones,
-            "technical_confidence_distribution": technical_confidence_levels,
+            "emotional_tone_distribution": dict(emotional_tones),
+            "technical_confidence_distribution": {k: technical_confidence_levels[k]
+                                                  for k in ("high", "medium", "low", "unknown")},
             "insights": insights,
             "confidence_trend": self._analyze_confidence_trend(analyses)
         }
@@ -170,8 +285,8 @@ class SentimentAnalyzer:
         if not first_half or not second_half:
             return "stable"
         
-        first_avg = statistics.mean(first_half)
-        second_avg = statistics.mean(second_half)
+        first_avg = sum(first_half) / len(first_half)
+        second_avg = sum(second_half) / len(second_half)
         
         if second_avg > first_avg + 0.1:
             return "increasing"
@@ -184,42 +299,28 @@ class SentimentAnalyzer:
                           confidence: float, sentiment_dist: Dict) -> List[str]:
         """Generate human-readable insights."""
         insights = []
-        
+
         # Sentiment insights
-        if sentiment == "positive":
-            insights.append("😊 The candidate showed a positive attitude throughout the interview")
-        elif sentiment == "negative":
-            insights.append("😟 The candidate showed some signs of stress or negativity")
-        else:
-            insights.append("😐 The candidate maintained a neutral tone throughout")
-        
-        # Confidence insights
+        insights.append(_SENTIMENT_INSIGHTS.get(sentiment, _NEUTRAL_SENTIMENT_INSIGHT))
+
+        # Confidence insights (numeric thresholds stay as comparisons)
         if confidence >= 0.8:
             insights.append("💪 High confidence level demonstrated in technical responses")
         elif confidence >= 0.6:
             insights.append("👍 Moderate confidence shown in answering questions")
         else:
             insights.append("🤔 Lower confidence levels - might need more support or different question approach")
-        
-        # Engagement insights
-        if engagement == "high":
-            insights.append("🚀 High engagement level - candidate was actively participating")
-        elif engagement == "low":
-            insights.append("📉 Lower engagement detected - candidate might have been disinterested or overwhelmed")
-        
+
+        # Engagement insights ("medium" intentionally produces none)
+        engagement_insight = _ENGAGEMENT_INSIGHTS.get(engagement)
+        if engagement_insight:
+            insights.append(engagement_insight)
+
         # Emotional tone insights
-        tone_insights = {
-            "confident": "💼 Candidate displayed strong self-assurance",
-            "enthusiastic": "⭐ Great enthusiasm and passion for technology",
-            "nervous": "😰 Some nervousness detected - normal for interview situations",
-            "frustrated": "😤 Signs of frustration - questions might have been too challenging",
-            "uncertain": "❓ Some uncertainty in responses - might need clearer questions",
-            "calm": "😌 Maintained calm and composed throughout"
-        }
-        
-        if tone in tone_insights:
-            insights.append(tone_insights[tone])
-        
+        tone_insight = _TONE_INSIGHTS.get(tone)
+        if tone_insight:
+            insights.append(tone_insight)
+
         return insights
     
     def _get_empty_analysis(self) -> Dict:
@@ -248,42 +349,25 @@ class SentimentAnalyzer:
 No responses available for sentiment analysis.
 """
         
-        report = f"""
-### 📊 Sentiment Analysis Report {f"for {candidate_name}" if candidate_name else ""}
-
-#### Overall Assessment
-- **Primary Sentiment:** {analysis['overall_sentiment'].title()} 
-- **Confidence Level:** {analysis['average_confidence']*100:.1f}%
-- **Emotional Tone:** {analysis['dominant_emotional_tone'].title()}
-- **Engagement Level:** {analysis['dominant_engagement_level'].title()}
-
-#### Response Statistics
-- **Total Questions:** {analysis['total_responses']}
-- **Responses Analyzed:** {analysis['analyzed_responses']}
-- **Questions Skipped:** {analysis['skipped_responses']}
-
-#### Sentiment Distribution
-- **Positive Responses:** {analysis['sentiment_distribution']['positive']:.1f}%
-- **Neutral Responses:** {analysis['sentiment_distribution']['neutral']:.1f}%
-- **Negative Responses:** {analysis['sentiment_distribution']['negative']:.1f}%
+        insights_block = "".join(f"- {insight}\n" for insight in analysis['insights'])
 
-#### Key Insights
-"""
-        
-        for insight in analysis['insights']:
-            report += f"- {insight}\n"
-        
-        # Confidence trend
-        trend_messages = {
-            "increasing": "📈 Confidence improved throughout the interview",
-            "decreasing": "📉 Confidence declined during the interview", 
-            "stable": "➡️ Confidence remained consistent throughout",
-            "insufficient_data": "📊 Not enough data to determine confidence trend",
-            "no_data": "❌ No confidence trend data available"
-        }
-        
         trend = analysis.get('confidence_trend', 'no_data')
-        if trend in trend_messages:
-            report += f"\n#### Confidence Trend\n- {trend_messages[trend]}\n"
-        
-        return report
\ No newline at end of file
+        trend_block = ""
+        if trend in _TREND_MESSAGES:
+            trend_block = f"\n#### Confidence Trend\n- {_TREND_MESSAGES[trend]}\n"
+
+        return _REPORT_TEMPLATE.format_map({
+            "for_name": f"for {candidate_name}" if candidate_name else "",
+            "overall_sentiment": analysis['overall_sentiment'].title(),
+            "confidence_pct": analysis['average_confidence'] * 100,
+            "emotional_tone": analysis['dominant_emotional_tone'].title(),
+            "engagement_level": analysis['dominant_engagement_level'].title(),
+            "total_responses": analysis['total_responses'],
+            "analyzed_responses": analysis['analyzed_responses'],
+            "skipped_responses": analysis['skipped_responses'],
+            "positive_pct": analysis['sentiment_distribution']['positive'],
+            "neutral_pct": analysis['sentiment_distribution']['neutral'],
+            "negative_pct": analysis['sentiment_distribution']['negative'],
+            "insights_block": insights_block,
+            "trend_block": trend_block,
+        })
\ No newline at end of file